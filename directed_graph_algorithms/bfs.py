@@ -1,5 +1,98 @@
 from digraph import *
-from collections import deque
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _bfs_csr(indptr, indices, rev_indptr, rev_indices, source, number_of_vertices):
+    """
+    Runs direction-optimizing BFS over a graph in CSR form, compiled to
+    native code.
+
+    Each level is expanded top-down (frontier vertices push their
+    out-edges) while the frontier is small, and bottom-up (unvisited
+    vertices scan their in-edges against a frontier bitmap) once the
+    frontier exceeds roughly V / 20, which avoids re-examining edges into
+    already-visited vertices on frontier-dominated levels. Preallocated
+    int32 arrays serve as the frontiers, avoiding any Python object
+    allocation in the hot loop.
+
+    Args:
+        indptr (numpy.ndarray): CSR row pointers, int32 array of size V + 1.
+        indices (numpy.ndarray): CSR adjacency indices, int32 array of size E.
+        rev_indptr (numpy.ndarray): Row pointers of the reverse graph.
+        rev_indices (numpy.ndarray): Adjacency indices of the reverse graph.
+        source (int): The source vertex from which to start the BFS.
+        number_of_vertices (int): The number of vertices in the graph.
+
+    Returns:
+        tuple: Arrays (marked, edge_to, dist_to) where marked is bool and
+            edge_to/dist_to are int32 with -1 for unreached vertices.
+    """
+
+    marked = np.zeros(number_of_vertices, dtype=np.bool_)
+    edge_to = np.full(number_of_vertices, -1, dtype=np.int32)
+    dist_to = np.full(number_of_vertices, -1, dtype=np.int32)
+    frontier = np.empty(number_of_vertices, dtype=np.int32)
+    next_frontier = np.empty(number_of_vertices, dtype=np.int32)
+    in_frontier = np.zeros(number_of_vertices, dtype=np.bool_)
+
+    # Start
+    frontier[0] = source
+    frontier_size = 1
+    marked[source] = True
+    dist_to[source] = 0
+    level = 0
+    threshold = number_of_vertices // 20 + 1
+
+    while frontier_size > 0:
+        next_size = 0
+
+        if frontier_size < threshold:
+            # Top-down: frontier vertices expand their out-edges
+            for i in range(frontier_size):
+                vertex = frontier[i]
+                for position in range(indptr[vertex], indptr[vertex + 1]):
+                    adjacent = indices[position]
+                    if not marked[adjacent]:
+                        marked[adjacent] = True
+                        edge_to[adjacent] = vertex
+                        dist_to[adjacent] = level + 1
+                        next_frontier[next_size] = adjacent
+                        next_size += 1
+        else:
+            # Bottom-up: unvisited vertices scan their in-edges against
+            # the frontier bitmap and stop at the first hit
+            for i in range(frontier_size):
+                in_frontier[frontier[i]] = True
+            for vertex in range(number_of_vertices):
+                if not marked[vertex]:
+                    for position in range(rev_indptr[vertex], rev_indptr[vertex + 1]):
+                        parent = rev_indices[position]
+                        if in_frontier[parent]:
+                            marked[vertex] = True
+                            edge_to[vertex] = parent
+                            dist_to[vertex] = level + 1
+                            next_frontier[next_size] = vertex
+                            next_size += 1
+                            break
+            for i in range(frontier_size):
+                in_frontier[frontier[i]] = False
+
+        frontier, next_frontier = next_frontier, frontier
+        frontier_size = next_size
+        level += 1
+
+    return marked, edge_to, dist_to
+
+
+# The kernel is written against plain arrays, so it also runs interpreted
+# where numba cannot be installed
+if njit is not None:
+    _bfs_csr = njit(cache=True)(_bfs_csr)
 
 
 class DirectedBFS:
@@ -10,29 +103,22 @@ class DirectedBFS:
     def __init__(self, graph, source):
         """
         Initializes the DirectedBFS object and performs BFS from the source vertex.
-        
+
+        The graph and its reverse are converted once to Compressed Sparse
+        Row (CSR) arrays and the traversal itself runs in the jit-compiled
+        direction-optimizing _bfs_csr kernel.
+
         Args:
             graph (Digraph): The directed graph to perform BFS on.
             source (int): The source vertex from which to start the BFS.
         """
 
-        self.marked = [False] * graph.number_of_vertices
-        self.edge_to = [None] * graph.number_of_vertices
-        self.dist_to = [0] * graph.number_of_vertices
-        queue = deque()
-
-        # Start
-        queue.append(source)
-        self.marked[source] = True
-        
-        while queue:
-            vertex = queue.popleft()
-            for adjacent in graph.adjacency_lists[vertex]:
-                if not self.marked[adjacent]:
-                    queue.append(adjacent)
-                    self.marked[adjacent] = True
-                    self.edge_to[adjacent] = vertex
-                    self.dist_to[adjacent] = self.dist_to[vertex] + 1
+        indptr, indices = graph.to_csr()
+        rev_indptr, rev_indices = Digraph.transpose_csr(
+            indptr, indices, graph.number_of_vertices)
+        self.marked, self.edge_to, self.dist_to = _bfs_csr(
+            indptr, indices, rev_indptr, rev_indices, source,
+            graph.number_of_vertices)
 
     def has_path_to(self, vertex):
         """
@@ -47,28 +133,50 @@ class DirectedBFS:
 
         return self.marked[vertex]
 
-    def path_to(self, vertex):
+    def path_vertices_to(self, vertex):
         """
         Returns the path from the source vertex to the given vertex, if it exists.
-        
+
+        The number of hops is known from dist_to, so the path is written
+        directly into a preallocated array from the tail, with no list
+        growth or reversal.
+
         Args:
             vertex (int): The target vertex.
-        
+
         Returns:
-            str: A string representation of the path from the source to the target.
+            numpy.ndarray: An int32 array of the vertices on the path,
+                from the source to the target.
             None: If no path exists.
         """
 
         if not self.has_path_to(vertex):
             return None
 
-        path = []
+        path = np.empty(self.dist_to[vertex] + 1, dtype=np.int32)
         current_vertex = vertex
 
-        while current_vertex is not None:
-            path.append(current_vertex)
+        for position in range(len(path) - 1, -1, -1):
+            path[position] = current_vertex
             current_vertex = self.edge_to[current_vertex]
-        return ' -> '.join(str(vertex) for vertex in reversed(path))
+        return path
+
+    def path_to(self, vertex):
+        """
+        Returns the path from the source vertex to the given vertex as a string.
+
+        Args:
+            vertex (int): The target vertex.
+
+        Returns:
+            str: A string representation of the path from the source to the target.
+            None: If no path exists.
+        """
+
+        path = self.path_vertices_to(vertex)
+        if path is None:
+            return None
+        return ' -> '.join(map(str, path))
 
 
 def main():
@@ -1,5 +1,6 @@
 import networkx as nx
 import matplotlib.pyplot as plt
+import numpy as np
 
 
 class Digraph:
@@ -27,7 +28,7 @@ class Digraph:
             int: The total number of edges.
         """
 
-        return sum([len(adjacency_list) for adjacency_list in self.adjacency_lists.values()])
+        return sum(len(adjacency_list) for adjacency_list in self.adjacency_lists.values())
 
     def add_edge(self, vertex_v, vertex_w):
         """
@@ -85,7 +86,7 @@ class Digraph:
             int: The maximum out-degree.
         """
 
-        return max([len(adjacency_list) for adjacency_list in self.adjacency_lists.values()])
+        return max(len(adjacency_list) for adjacency_list in self.adjacency_lists.values())
 
     def average_degree(self):
         """
@@ -112,6 +113,60 @@ class Digraph:
                     count += 1
         return count
 
+    def to_csr(self):
+        """
+        Returns the graph in Compressed Sparse Row (CSR) form.
+
+        The vertices adjacent to a vertex v are stored contiguously in
+        indices[indptr[v]:indptr[v + 1]], which traversal loops can scan
+        without chasing per-vertex Python containers.
+
+        Returns:
+            tuple: A pair (indptr, indices) of numpy.int32 arrays of sizes
+                V + 1 and E respectively.
+        """
+
+        indptr = np.zeros(self.number_of_vertices + 1, dtype=np.int32)
+        for vertex in range(self.number_of_vertices):
+            indptr[vertex + 1] = indptr[vertex] + len(self.adjacency_lists[vertex])
+
+        indices = np.fromiter(
+            (adjacent for vertex in range(self.number_of_vertices)
+             for adjacent in self.adjacency_lists[vertex]),
+            dtype=np.int32, count=int(indptr[-1]))
+
+        return indptr, indices
+
+    @staticmethod
+    def transpose_csr(indptr, indices, number_of_vertices):
+        """
+        Transposes a graph in CSR form without building a new Digraph.
+
+        A histogram of the target vertices yields the reverse row pointers
+        and a stable counting scatter groups each edge under its target,
+        so the transpose runs at numpy speed instead of per-edge Python
+        list operations.
+
+        Args:
+            indptr (numpy.ndarray): CSR row pointers of the graph.
+            indices (numpy.ndarray): CSR adjacency indices of the graph.
+            number_of_vertices (int): The number of vertices in the graph.
+
+        Returns:
+            tuple: A pair (rev_indptr, rev_indices) of numpy.int32 arrays
+                holding the reversed graph in CSR form.
+        """
+
+        counts = np.bincount(indices, minlength=number_of_vertices)
+        rev_indptr = np.zeros(number_of_vertices + 1, dtype=np.int32)
+        rev_indptr[1:] = np.cumsum(counts)
+
+        sources = np.repeat(np.arange(number_of_vertices, dtype=np.int32),
+                            np.diff(indptr))
+        rev_indices = sources[np.argsort(indices, kind='stable')]
+
+        return rev_indptr, rev_indices
+
     @classmethod
     def from_file(cls, file_path):
         """
@@ -124,18 +179,16 @@ class Digraph:
             Digraph: An instance of the Digraph class.
         """
         with open(file_path, 'r') as file:
-            # Read the first two lines
+            # Read the number of vertices, then parse the edge block at
+            # C level instead of splitting and casting line by line
             number_of_vertices = int(file.readline().rstrip())
+            data = np.loadtxt(file, dtype=np.int32, ndmin=2)
 
-            # Print the first two lines
-            digraph = cls(number_of_vertices)
+        digraph = cls(number_of_vertices)
+        for vertex_v, vertex_w in data.tolist():
+            digraph.add_edge(vertex_v, vertex_w)
 
-            # Iterate over the rest of the file
-            for line in file:
-                vertex_v, vertex_w = map(int, line.rstrip().split())
-                digraph.add_edge(vertex_v, vertex_w)
-
-            return digraph
+        return digraph
 
     @classmethod
     def reverse_graph(cls, graph):
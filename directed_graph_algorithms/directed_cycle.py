@@ -1,5 +1,6 @@
 from collections import deque
 from digraph import *
+import numpy as np
 
 class DirectedCycle:
     """
@@ -14,10 +15,11 @@ class DirectedCycle:
             graph (Digraph): The directed graph to check for cycles.
         """
 
-        self.marked = [False] * graph.number_of_vertices
-        self.on_stack = [False] * graph.number_of_vertices
+        self.marked = np.zeros(graph.number_of_vertices, dtype=np.uint8)
+        self.on_stack = np.zeros(graph.number_of_vertices, dtype=np.uint8)
         self.edge_to = [None] * graph.number_of_vertices
         self.cycle = deque()
+        self._indptr, self._indices = graph.to_csr()
 
         vertex = 0
         while vertex < graph.number_of_vertices and not self.has_cycle:
@@ -39,27 +41,39 @@ class DirectedCycle:
 
     def _dfs(self, graph, vertex):
         """
-        Recursively performs DFS to detect cycles in the graph.
-        
+        Iteratively performs DFS to detect cycles in the graph.
+
+        An explicit stack of (vertex, cursor) pairs replaces recursion,
+        where the cursor is the position of the next unexplored neighbor in
+        the CSR indices array. A back edge to a vertex still on the stack
+        signals a cycle, reconstructed through edge_to.
+
         Args:
             graph (Digraph): The directed graph to check.
-            vertex (int): The current vertex being visited.
+            vertex (int): The vertex from which to start the search.
         """
 
         self.marked[vertex] = True
         self.on_stack[vertex] = True
-        for adjacent in graph.adjacency_lists[vertex]:
-            if self.has_cycle:
-                return
-
-            if not self.marked[adjacent]:
-                self.edge_to[adjacent] = vertex
-                self._dfs(graph, adjacent)
-
-            elif self.on_stack[adjacent]:
-                self._get_cycle_path(vertex, adjacent)
-
-        self.on_stack[vertex] = False
+        stack = [(vertex, self._indptr[vertex])]
+
+        while stack and not self.has_cycle:
+            current_vertex, cursor = stack[-1]
+            if cursor < self._indptr[current_vertex + 1]:
+                stack[-1] = (current_vertex, cursor + 1)
+                adjacent = self._indices[cursor]
+
+                if not self.marked[adjacent]:
+                    self.marked[adjacent] = True
+                    self.on_stack[adjacent] = True
+                    self.edge_to[adjacent] = current_vertex
+                    stack.append((adjacent, self._indptr[adjacent]))
+
+                elif self.on_stack[adjacent]:
+                    self._get_cycle_path(current_vertex, adjacent)
+            else:
+                stack.pop()
+                self.on_stack[current_vertex] = False
 
     def _get_cycle_path(self, vertex, adjacent):
         """
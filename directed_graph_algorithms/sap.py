@@ -1,5 +1,6 @@
 from digraph import *
 from collections import deque
+import numpy as np
 
 
 class SAP:
@@ -17,6 +18,11 @@ class SAP:
         """
 
         self.graph = graph
+        self._indptr, self._indices = graph.to_csr()
+        self._dist_v = np.full(graph.number_of_vertices, -1, dtype=np.int32)
+        self._dist_w = np.full(graph.number_of_vertices, -1, dtype=np.int32)
+        self._touched_v = []
+        self._touched_w = []
         self._length = None
         self._sca = None
 
@@ -101,82 +107,110 @@ class SAP:
         self._sca = None
         self._length = float('inf')
 
-        # Initialize data structures for bidirectional BFS
+        # Sparse reset: clear only the entries the previous query touched,
+        # O(reachable) instead of O(V); -1 doubles as the unvisited flag
         queue_v, queue_w = deque(), deque()
-        dist_to_v, dist_to_w = {}, {}
-        visited_v, visited_w = set(), set()
+        dist_to_v, dist_to_w = self._dist_v, self._dist_w
 
-        # To check if there are common elements in lists vertex_v and vertex_w
-        set_check = set()
+        if self._touched_v:
+            dist_to_v[self._touched_v] = -1
+            self._touched_v.clear()
 
+        if self._touched_w:
+            dist_to_w[self._touched_w] = -1
+            self._touched_w.clear()
+
+        # Enqueue every source from both sides before searching, so a
+        # single simultaneous BFS covers all pairs in O(V + E)
         for vertex in vertex_v:
-            set_check.add(vertex)
             queue_v.append(vertex)
             dist_to_v[vertex] = 0
-            visited_v.add(vertex)
+            self._touched_v.append(vertex)
 
         for vertex in vertex_w:
             # If there is a common element that element is the sca
-            if vertex in set_check:
-                self._sca = vertex_w
+            if dist_to_v[vertex] >= 0:
+                self._sca = vertex
                 self._length = 0
                 return
 
             queue_w.append(vertex)
             dist_to_w[vertex] = 0
-            visited_w.add(vertex)
+            self._touched_w.append(vertex)
 
-            self._bidirectional_bfs(queue_v, queue_w, dist_to_v, dist_to_w, visited_v, visited_w)
+        self._bidirectional_bfs(queue_v, queue_w, dist_to_v, dist_to_w)
 
-            if self._sca is None:
-                self._length = None
+        if self._sca is None:
+            self._length = None
 
-    def _bidirectional_bfs(self, queue_v, queue_w, dist_to_v, dist_to_w, visited_v, visited_w):
+    def _bidirectional_bfs(self, queue_v, queue_w, dist_to_v, dist_to_w):
         """
         Performs bidirectional BFS from the source vertices.
-        
+
         Args:
             queue_v (deque): The BFS queue for the first set of vertices.
             queue_w (deque): The BFS queue for the second set of vertices.
-            dist_to_v (dict): The distances from the source vertices in vertex_v.
-            dist_to_w (dict): The distances from the source vertices in vertex_w.
-            visited_v (set): The set of visited vertices from vertex_v.
-            visited_w (set): The set of visited vertices from vertex_w.
+            dist_to_v (numpy.ndarray): Distances from the vertices in vertex_v,
+                -1 for unvisited.
+            dist_to_w (numpy.ndarray): Distances from the vertices in vertex_w,
+                -1 for unvisited.
         """
 
         while queue_v or queue_w:
+            # Early termination: any ancestor found from here on lies at
+            # least as deep as the best path already recorded
+            next_dist = float('inf')
             if queue_v:
-                self._bfs(queue_v, dist_to_v, dist_to_w, visited_v, visited_w)
+                next_dist = min(next_dist, dist_to_v[queue_v[0]] + 1)
+            if queue_w:
+                next_dist = min(next_dist, dist_to_w[queue_w[0]] + 1)
+            if next_dist >= self._length:
+                return
+
+            if queue_v:
+                self._bfs(queue_v, dist_to_v, dist_to_w, self._touched_v)
 
             if queue_w:
-                self._bfs(queue_w, dist_to_w, dist_to_v, visited_w, visited_v)
+                self._bfs(queue_w, dist_to_w, dist_to_v, self._touched_w)
 
-    def _bfs(self, queue, dist_to_current, dist_to_other, visited_current, visited_other):
+    def _bfs(self, queue, dist_to_current, dist_to_other, touched_current):
         """
         Performs a single BFS step.
-        
+
+        The CSR arrays are bound to locals so the inner loop avoids
+        attribute lookups, and the visited check is a single array read
+        (dist >= 0) instead of a hash probe. Every newly visited vertex is
+        recorded in touched_current so the next query can reset sparsely.
+
         Args:
             queue (deque): The BFS queue for the current set of vertices.
-            dist_to_current (dict): The distances from the source vertices in the current set.
-            dist_to_other (dict): The distances from the source vertices in the other set.
-            visited_current (set): The set of visited vertices from the current set.
-            visited_other (set): The set of visited vertices from the other set.
+            dist_to_current (numpy.ndarray): Distances from the current set,
+                -1 for unvisited.
+            dist_to_other (numpy.ndarray): Distances from the other set,
+                -1 for unvisited.
+            touched_current (list): Vertices whose distance entry was set
+                during this query.
         """
 
+        indptr = self._indptr
+        indices = self._indices
+
         vertex = queue.popleft()
+        next_dist = dist_to_current[vertex] + 1
 
-        for neighbor in self.graph.adjacents(vertex):
-            if not neighbor in visited_current:
+        for position in range(indptr[vertex], indptr[vertex + 1]):
+            neighbor = indices[position]
+            if dist_to_current[neighbor] < 0:
                 queue.append(neighbor)
-                visited_current.add(neighbor)
-                dist_to_current[neighbor] = dist_to_current[vertex] + 1
+                dist_to_current[neighbor] = next_dist
+                touched_current.append(neighbor)
 
-                if neighbor in visited_other:
-                    total_dist = dist_to_current[neighbor] + dist_to_other[neighbor]
+                if dist_to_other[neighbor] >= 0:
+                    total_dist = next_dist + dist_to_other[neighbor]
 
                     if total_dist < self._length:
-                        self._length = total_dist
-                        self._sca = neighbor
+                        self._length = int(total_dist)
+                        self._sca = int(neighbor)
 
 
 def main():
@@ -1,5 +1,6 @@
 from digraph import Digraph
 from topological_order import TopologicalOrder
+import numpy as np
 
 
 class StrongComponents:
@@ -16,12 +17,16 @@ class StrongComponents:
             graph (Digraph): The directed graph to analyze for strongly connected components.
         """
 
-        self.marked = [False] * graph.number_of_vertices
+        self.marked = np.zeros(graph.number_of_vertices, dtype=np.uint8)
         self.id = [None] * graph.number_of_vertices
         self._component = 0
+        self._indptr, self._indices = graph.to_csr()
 
-        reversed_graph = Digraph.reverse_graph(graph)
-        topological_sort = TopologicalOrder(reversed_graph)
+        # Transposing the CSR arrays avoids rebuilding the adjacency sets
+        # of a full reversed Digraph edge by edge
+        reversed_csr = Digraph.transpose_csr(
+            self._indptr, self._indices, graph.number_of_vertices)
+        topological_sort = TopologicalOrder(graph, csr=reversed_csr)
 
         for vertex in reversed(topological_sort.reverse_postorder):
             if not self.marked[vertex]:
@@ -30,19 +35,33 @@ class StrongComponents:
 
     def _dfs(self, graph, vertex, component):
         """
-        Recursively performs DFS to identify all vertices in the same component.
-        
+        Iteratively performs DFS to identify all vertices in the same component.
+
+        An explicit stack of (vertex, cursor) pairs replaces recursion, where
+        the cursor is the position of the next unexplored neighbor in the CSR
+        indices array.
+
         Args:
             graph (Digraph): The graph to analyze.
-            vertex (int): The current vertex being visited.
+            vertex (int): The vertex from which to start the search.
             component (int): The component identifier.
         """
 
         self.marked[vertex] = True
         self.id[vertex] = component
-        for adjacent in graph.adjacency_lists[vertex]:
-            if not self.marked[adjacent]:
-                self._dfs(graph, adjacent, component)
+        stack = [(vertex, self._indptr[vertex])]
+
+        while stack:
+            current_vertex, cursor = stack[-1]
+            if cursor < self._indptr[current_vertex + 1]:
+                stack[-1] = (current_vertex, cursor + 1)
+                adjacent = self._indices[cursor]
+                if not self.marked[adjacent]:
+                    self.marked[adjacent] = True
+                    self.id[adjacent] = component
+                    stack.append((adjacent, self._indptr[adjacent]))
+            else:
+                stack.pop()
 
     def connected(self, vertex_v, vertex_w):
         """
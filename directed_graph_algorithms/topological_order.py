@@ -1,4 +1,5 @@
 from digraph import Digraph
+import numpy as np
 
 
 class TopologicalOrder:
@@ -6,16 +7,19 @@ class TopologicalOrder:
     Implements topological sorting for a directed acyclic graph (DAG).
     """
 
-    def __init__(self, graph):
+    def __init__(self, graph, csr=None):
         """
         Initializes the TopologicalOrder object and performs DFS to find the topological order.
-        
+
         Args:
             graph (Digraph): The directed acyclic graph to perform topological sorting on.
+            csr (tuple, optional): Precomputed (indptr, indices) CSR arrays
+                for the graph, to avoid rebuilding them.
         """
 
-        self.marked = [False] * graph.number_of_vertices
+        self.marked = np.zeros(graph.number_of_vertices, dtype=np.uint8)
         self.reverse_postorder = []
+        self._indptr, self._indices = csr if csr is not None else graph.to_csr()
 
         for vertex in range(graph.number_of_vertices):
             if not self.marked[vertex]:
@@ -23,18 +27,32 @@ class TopologicalOrder:
 
     def _dfs(self, graph, vertex):
         """
-        Recursively performs DFS to compute the reverse postorder.
-        
+        Iteratively performs DFS to compute the reverse postorder.
+
+        An explicit stack of (vertex, cursor) pairs replaces recursion, so
+        large graphs cannot hit the CPython recursion limit and no call
+        frames are allocated per vertex. The cursor is the position of the
+        next unexplored neighbor in the CSR indices array.
+
         Args:
             graph (Digraph): The directed acyclic graph to perform DFS on.
-            vertex (int): The current vertex being visited.
+            vertex (int): The vertex from which to start the search.
         """
 
         self.marked[vertex] = True
-        for adjacent in graph.adjacency_lists[vertex]:
-            if not self.marked[adjacent]:
-                self._dfs(graph, adjacent)
-        self.reverse_postorder.append(vertex)
+        stack = [(vertex, self._indptr[vertex])]
+
+        while stack:
+            current_vertex, cursor = stack[-1]
+            if cursor < self._indptr[current_vertex + 1]:
+                stack[-1] = (current_vertex, cursor + 1)
+                adjacent = self._indices[cursor]
+                if not self.marked[adjacent]:
+                    self.marked[adjacent] = True
+                    stack.append((adjacent, self._indptr[adjacent]))
+            else:
+                stack.pop()
+                self.reverse_postorder.append(int(current_vertex))
 
     def get_order(self):
         """
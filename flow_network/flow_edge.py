@@ -14,6 +14,7 @@ class FlowEdge:
         """
         self._vertex_v = vertex_v
         self._vertex_w = vertex_w
+        self._xor = vertex_v ^ vertex_w
         self._capacity = capacity
         self._flow = 0.0
 
@@ -78,60 +79,47 @@ class FlowEdge:
     def other(self, vertex):
         """
         Returns the other vertex of the edge.
-        
+
+        Branchless: XOR-ing both endpoints with one of them yields the
+        other, so no comparison runs in the hot path. The vertex must be an
+        endpoint of the edge; this is not checked here.
+
         Args:
             vertex (int): One vertex of the edge.
-        
+
         Returns:
             int: The other vertex of the edge.
-        
-        Raises:
-            ValueError: If the given vertex is not one of the vertices of the edge.
         """
-        if vertex == self.vertex_v:
-            return self.vertex_w
-        elif vertex == self.vertex_w:
-            return self.vertex_v
-        else:
-            raise ValueError("Illegal endpoint")
+        return self._xor ^ vertex
 
     def residual_capacity_to(self, vertex):
         """
         Returns the residual capacity to the given vertex.
-        
+
+        The vertex must be an endpoint of the edge; this is not checked here.
+
         Args:
             vertex (int): The target vertex.
-        
+
         Returns:
             float: The residual capacity to the vertex.
-        
-        Raises:
-            ValueError: If the given vertex is not one of the vertices of the edge.
         """
-        if vertex == self.vertex_v:
-            return self.flow
-        elif vertex == self.vertex_w:
-            return self.capacity - self.flow
-        else:
-            raise ValueError("Illegal endpoint")
+        return self._capacity - self._flow if vertex == self._vertex_w else self._flow
 
     def add_residual_flow_to(self, vertex, delta):
         """
         Adds residual flow to the given vertex.
-        
+
+        The vertex must be an endpoint of the edge; this is not checked here.
+
         Args:
             vertex (int): The target vertex.
             delta (float): The flow to be added.
-        
-        Raises:
-            ValueError: If the given vertex is not one of the vertices of the edge.
         """
-        if vertex == self.vertex_v:
-            self._flow -= delta
-        elif vertex == self.vertex_w:
+        if vertex == self._vertex_w:
             self._flow += delta
         else:
-            raise ValueError("Illegal endpoint")
+            self._flow -= delta
 
     def __repr__(self):
         """
@@ -1,87 +1,176 @@
-from flow_edge import FlowEdge
 import networkx as nx
 import matplotlib.pyplot as plt
+import numpy as np
 
 
 class FlowNetwork:
     """
-    Represents a flow network using adjacency lists.
+    Represents a flow network using Structure-of-Arrays edge storage.
+
+    Edges live in parallel numpy arrays (head, tail, cap, flow) indexed by
+    edge number, and the adjacency structure stores edge indices in CSR
+    form, so traversals touch contiguous arrays instead of heap-allocated
+    edge objects.
     """
 
     def __init__(self, number_of_vertices):
         """
         Initializes a flow network with the specified number of vertices.
-        
+
         Args:
             number_of_vertices (int): The number of vertices in the network.
         """
         self.number_of_vertices = number_of_vertices
-        self.adjacency_lists = {vertex: [] for vertex in range(self.number_of_vertices)}
+        self.number_of_edges = 0
+        self._edge_list = []
+        self._dirty = True
 
-    def add_edge(self, edge):
+    def add_edge(self, vertex_v, vertex_w, capacity):
         """
-        Adds a flow edge to the network.
-        
+        Adds a flow edge from vertex_v to vertex_w to the network.
+
         Args:
-            edge (FlowEdge): The edge to be added to the network.
+            vertex_v (int): The source vertex of the edge.
+            vertex_w (int): The destination vertex of the edge.
+            capacity (float): The capacity of the edge.
         """
-        vertex_v = edge.from_edge()
-        vertex_w = edge.to_edge()
-        self.adjacency_lists[vertex_v].append(edge)
-        self.adjacency_lists[vertex_w].append(edge)
+        if not isinstance(self._edge_list, list):
+            # Bulk-loaded edges arrive as a numpy block; fall back to a
+            # list only when edges are added incrementally afterwards
+            self._edge_list = list(self._edge_list)
+
+        self._edge_list.append((vertex_v, vertex_w, capacity))
+        self.number_of_edges += 1
+        self._dirty = True
+
+    def _build_arrays(self):
+        """
+        Builds the SoA edge arrays and the CSR adjacency from the edge list.
+
+        Runs only when edges were added since the last build, so flow
+        values accumulated by an algorithm are never reset behind its back.
+        """
+        if not self._dirty:
+            return
+
+        edges = np.asarray(self._edge_list, dtype=np.float64).reshape(self.number_of_edges, 3)
+        self.head = edges[:, 0].astype(np.int32)
+        self.tail = edges[:, 1].astype(np.int32)
+        self.cap = np.ascontiguousarray(edges[:, 2])
+        self.flow = np.zeros(self.number_of_edges, dtype=np.float64)
+
+        # Every edge index appears in the adjacency of both endpoints
+        endpoints = np.concatenate((self.head, self.tail))
+        degrees = np.bincount(endpoints, minlength=self.number_of_vertices)
+        self.adj_indptr = np.zeros(self.number_of_vertices + 1, dtype=np.int32)
+        np.cumsum(degrees, out=self.adj_indptr[1:])
+
+        self.adj_edges = np.empty(2 * self.number_of_edges, dtype=np.int32)
+        cursor = self.adj_indptr[:-1].copy()
+        for edge in range(self.number_of_edges):
+            for vertex in (self.head[edge], self.tail[edge]):
+                self.adj_edges[cursor[vertex]] = edge
+                cursor[vertex] += 1
+
+        self._dirty = False
 
     def adjacents(self, vertex_v):
         """
-        Returns the edges adjacent to the given vertex.
-        
+        Returns the indices of the edges adjacent to the given vertex.
+
         Args:
             vertex_v (int): The vertex for which adjacent edges are to be returned.
-        
+
+        Returns:
+            numpy.ndarray: An int32 array of edge indices incident to the vertex.
+        """
+        self._build_arrays()
+        return self.adj_edges[self.adj_indptr[vertex_v]:self.adj_indptr[vertex_v + 1]]
+
+    def other(self, edge, vertex):
+        """
+        Returns the other endpoint of the given edge.
+
+        Args:
+            edge (int): The edge index.
+            vertex (int): One endpoint of the edge.
+
+        Branchless: XOR-ing both endpoints with one of them yields the
+        other, so no comparison runs in the hot path. The vertex must be an
+        endpoint of the edge; this is not checked here.
+
         Returns:
-            list: A list of edges adjacent to the given vertex.
+            int: The other endpoint of the edge.
         """
-        return self.adjacency_lists[vertex_v]
+        return int(self.head[edge] ^ self.tail[edge] ^ vertex)
+
+    def residual_capacity_to(self, edge, vertex):
+        """
+        Returns the residual capacity of the given edge towards the vertex.
+
+        Args:
+            edge (int): The edge index.
+            vertex (int): The target vertex.
+
+        Returns:
+            float: The residual capacity to the vertex.
+        """
+        if vertex == self.head[edge]:
+            return self.flow[edge]
+        return self.cap[edge] - self.flow[edge]
+
+    def add_residual_flow_to(self, edge, vertex, delta):
+        """
+        Adds residual flow on the given edge towards the vertex.
+
+        Args:
+            edge (int): The edge index.
+            vertex (int): The target vertex.
+            delta (float): The flow to be added.
+        """
+        if vertex == self.head[edge]:
+            self.flow[edge] -= delta
+        else:
+            self.flow[edge] += delta
 
     @classmethod
     def from_file(cls, file_path):
         """
         Creates a flow network from a file.
-        
+
         Args:
             file_path (str): The path to the file containing the network data.
-        
+
         Returns:
             FlowNetwork: An instance of the FlowNetwork class.
         """
         with open(file_path, 'r') as file:
-            # Read the first two lines
+            # Read the number of vertices, then parse the edge block at
+            # C level instead of splitting and casting line by line
             number_of_vertices = int(file.readline().rstrip())
+            data = np.loadtxt(file, dtype=np.float64, ndmin=2)
 
-            # Print the first two lines
-            graph = cls(number_of_vertices)
-
-            # Iterate over the rest of the file
-            for line in file:
-                vertex_v, vertex_w, capacity = line.rstrip().split()
-                vertex_v, vertex_w, capacity = int(vertex_v), int(vertex_w), float(capacity)
-                edge = FlowEdge(vertex_v, vertex_w, capacity)
-                graph.add_edge(edge)
+        graph = cls(number_of_vertices)
+        graph._edge_list = data
+        graph.number_of_edges = int(data.shape[0])
 
-            return graph
+        return graph
 
     def to_networkx_graph(self):
         """
         Converts the flow network to a NetworkX directed graph.
-        
+
         Returns:
             networkx.DiGraph: A NetworkX directed graph representing the same flow network.
         """
+        self._build_arrays()
         graph = nx.DiGraph()
 
-        # Add Edges to NetworkX Graph
-        for vertex_v in range(self.number_of_vertices):
-            for edge in self.adjacency_lists[vertex_v]:
-                graph.add_edge(edge.vertex_v, edge.vertex_w, capacity=edge.capacity, flow=edge.flow)
+        # Emit edges straight from the SoA arrays in a single pass
+        graph.add_edges_from(
+            (int(head), int(tail), {'capacity': cap, 'flow': flow})
+            for head, tail, cap, flow
+            in zip(self.head, self.tail, self.cap, self.flow))
         return graph
 
 
@@ -111,4 +200,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
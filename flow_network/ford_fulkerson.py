@@ -1,39 +1,185 @@
 from flow_network import FlowNetwork
-from collections import deque
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = prange = None
+
+
+def _bfs_levels(adj_indptr, adj_edges, head, tail, cap, flow, source, number_of_vertices):
+    """
+    Builds the residual level graph with a parallel level-synchronous BFS.
+
+    Each level expands its frontier vertices across threads with prange;
+    concurrent writes to level[w] all store the same value, so the race is
+    benign, and the next frontier is compacted afterwards with np.where.
+
+    Args:
+        adj_indptr (numpy.ndarray): CSR row pointers of the adjacency.
+        adj_edges (numpy.ndarray): CSR adjacency of edge indices.
+        head (numpy.ndarray): Source vertex of each edge.
+        tail (numpy.ndarray): Destination vertex of each edge.
+        cap (numpy.ndarray): Capacity of each edge.
+        flow (numpy.ndarray): Current flow on each edge.
+        source (int): The source vertex.
+        number_of_vertices (int): The number of vertices in the network.
+
+    Returns:
+        numpy.ndarray: int32 level per vertex, -1 where unreachable.
+    """
+
+    level = np.full(number_of_vertices, -1, dtype=np.int32)
+    level[source] = 0
+    frontier = np.full(1, source, dtype=np.int32)
+    current_level = 0
+
+    while frontier.size > 0:
+        for i in prange(frontier.size):
+            vertex_v = frontier[i]
+            for position in range(adj_indptr[vertex_v], adj_indptr[vertex_v + 1]):
+                edge = adj_edges[position]
+                vertex_w = head[edge] ^ tail[edge] ^ vertex_v
+
+                if vertex_w == head[edge]:
+                    residual = flow[edge]
+                else:
+                    residual = cap[edge] - flow[edge]
+
+                if residual > 0 and level[vertex_w] == -1:
+                    level[vertex_w] = current_level + 1
+
+        current_level += 1
+        frontier = np.where(level == current_level)[0].astype(np.int32)
+
+    return level
+
+
+def _bfs_levels_numpy(adj_indptr, adj_edges, head, tail, cap, flow, source, number_of_vertices):
+    """
+    Pure-numpy counterpart of _bfs_levels, vectorized per level.
+
+    The ragged adjacency slices of the whole frontier are gathered into
+    one flat edge array, residuals are computed as a single ufunc
+    expression and the next frontier falls out of a boolean mask, so each
+    level runs as SIMD array operations instead of per-edge Python calls.
+
+    Args:
+        Same as _bfs_levels.
+
+    Returns:
+        numpy.ndarray: int32 level per vertex, -1 where unreachable.
+    """
+
+    level = np.full(number_of_vertices, -1, dtype=np.int32)
+    level[source] = 0
+    frontier = np.full(1, source, dtype=np.int32)
+    current_level = 0
+
+    while frontier.size > 0:
+        starts = adj_indptr[frontier]
+        counts = adj_indptr[frontier + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            break
+
+        # Flatten the ragged slices adj_edges[starts[i]:starts[i]+counts[i]]
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        edges = adj_edges[np.repeat(starts, counts) + offsets]
+        origins = np.repeat(frontier, counts)
+
+        others = head[edges] ^ tail[edges] ^ origins
+        residuals = np.where(others == head[edges], flow[edges], cap[edges] - flow[edges])
+        mask = (residuals > 0) & (level[others] == -1)
+
+        current_level += 1
+        frontier = np.unique(others[mask]).astype(np.int32)
+        level[frontier] = current_level
+
+    return level
+
+
+if njit is not None:
+    _bfs_levels = njit(parallel=True, cache=True)(_bfs_levels)
+else:
+    _bfs_levels = _bfs_levels_numpy
 
 
 class FordFulkerson:
     """
-    Implements the Ford-Fulkerson algorithm to compute the maximum flow in a flow network.
+    Computes the maximum flow in a flow network with Dinic's variant of the
+    Ford-Fulkerson method: each BFS builds a level graph and a blocking-flow
+    DFS then drains every shortest augmenting path it admits, so one BFS
+    amortizes many augmentations.
     """
 
     def __init__(self, digraph, source, target):
         """
         Initializes the FordFulkerson object and computes the maximum flow from the source to the target vertex.
-        
+
         Args:
             digraph (FlowNetwork): The flow network.
             source (int): The source vertex.
             target (int): The target vertex.
         """
-        self._edge_to = [None] * digraph.number_of_vertices
-        self._marked = [False] * digraph.number_of_vertices
+        self._level = np.full(digraph.number_of_vertices, -1, dtype=np.int32)
+        self._marked = np.zeros(digraph.number_of_vertices, dtype=np.uint8)
+        self._current_edge = np.zeros(digraph.number_of_vertices, dtype=np.int32)
         self._value = 0.0
 
         while self._has_augmenting_path(digraph, source, target):
-            bottle = float('inf')
-            current = target
+            # Blocking flow: augment along level-increasing paths until the
+            # level graph admits no more
+            self._current_edge.fill(0)
+            bottle = self._dfs(digraph, source, target, float('inf'))
+
+            while bottle > 0:
+                self._value += bottle
+                bottle = self._dfs(digraph, source, target, float('inf'))
+
+    def _dfs(self, digraph, vertex, target, bound):
+        """
+        Pushes flow along one level-increasing path in the level graph.
+
+        The _current_edge cursor per vertex skips edges already proven dead
+        in this phase, so each edge is scanned at most once per level graph.
+
+        Args:
+            digraph (FlowNetwork): The flow network.
+            vertex (int): The vertex currently being explored.
+            target (int): The target vertex.
+            bound (float): The bottleneck capacity along the path so far.
 
-            while current != source:
-                bottle = min(bottle, self._edge_to[current].residual_capacity_to(current))
-                current = self._edge_to[current].other(current)
+        Returns:
+            float: The flow pushed, or 0 if no augmenting path remains.
+        """
+        if vertex == target:
+            return bound
+
+        adjacent_edges = digraph.adjacents(vertex)
+        head = digraph.head
+        tail = digraph.tail
+        cap = digraph.cap
+        flow = digraph.flow
+
+        while self._current_edge[vertex] < len(adjacent_edges):
+            edge = adjacent_edges[self._current_edge[vertex]]
+            vertex_w = int(head[edge] ^ tail[edge] ^ vertex)
+
+            # Resolve the edge direction once and reuse it for both the
+            # residual read and the flow update
+            backward = vertex_w == head[edge]
+            residual = flow[edge] if backward else cap[edge] - flow[edge]
+
+            if residual > 0 and self._level[vertex_w] == self._level[vertex] + 1:
+                pushed = self._dfs(digraph, vertex_w, target, min(bound, residual))
+                if pushed > 0:
+                    flow[edge] += -pushed if backward else pushed
+                    return pushed
 
-            current = target
-            while current != source:
-                self._edge_to[current].add_residual_flow_to(current, bottle)
-                current = self._edge_to[current].other(current)
+            self._current_edge[vertex] += 1
 
-            self._value += bottle
+        return 0
 
     @property
     def value(self):
@@ -57,35 +203,26 @@ class FordFulkerson:
 
     def _has_augmenting_path(self, digraph, source, target):
         """
-        Checks if there is an augmenting path from source to target using BFS.
-        
+        Builds the level graph of the residual network using the parallel
+        jit-compiled _bfs_levels kernel.
+
         Args:
             digraph (FlowNetwork): The flow network.
             source (int): The source vertex.
             target (int): The target vertex.
-        
+
         Returns:
-            bool: True if there is an augmenting path, False otherwise.
+            bool: True if the target is reachable in the residual network.
         """
 
-        # Reset the lists
-        self._edge_to[:] = [None] * len(self._edge_to)
-        self._marked[:] = [False] * len(self._marked)
-
-        # Implement the BFS to find an augmenting path
-        queue = deque([source])
-        self._marked[source] = True
-
-        while queue:
-            vertex_v = queue.popleft()
-            for edge in digraph.adjacents(vertex_v):
-                vertex_w = edge.other(vertex_v)
-                if edge.residual_capacity_to(vertex_w) > 0 and not self._marked[vertex_w]:
-                    self._edge_to[vertex_w] = edge
-                    self._marked[vertex_w] = True
-                    queue.append(vertex_w)
+        digraph._build_arrays()
+        self._level = _bfs_levels(
+            digraph.adj_indptr, digraph.adj_edges, digraph.head,
+            digraph.tail, digraph.cap, digraph.flow, source,
+            digraph.number_of_vertices)
+        self._marked = (self._level >= 0).astype(np.uint8)
 
-        return self._marked[target]
+        return self._level[target] >= 0
 
 
 def main():
@@ -1,46 +1,203 @@
 from weighted_edge import WeightedEdge
 import networkx as nx
 import matplotlib.pyplot as plt
+import numpy as np
 
 
 class EdgeWeightedGraph:
     """
-    Represents an edge-weighted graph using adjacency lists.
+    Represents an edge-weighted graph using Structure-of-Arrays edge storage.
+
+    Edges live in parallel numpy arrays (edge_v, edge_w, edge_wt) indexed
+    by edge number and the adjacency lists hold edge indices, so the MST
+    algorithms chase array entries instead of per-edge Python objects.
+    WeightedEdge remains as a lightweight view built on demand.
     """
 
     def __init__(self, number_of_vertices):
         """
         Initializes an edge-weighted graph with the specified number of vertices.
-        
+
         Args:
             number_of_vertices (int): The number of vertices in the graph.
         """
         self.number_of_vertices = number_of_vertices
         self.adjacency_lists = {vertex: [] for vertex in range(self.number_of_vertices)}
-        self.edges = []
+        self.number_of_edges = 0
+        self._edge_list = []
+        self._dirty = True
+        self._csr_dirty = True
 
     def add_edge(self, edge):
         """
         Adds a weighted edge to the graph.
-        
+
         Args:
             edge (WeightedEdge): The edge to be added to the graph.
         """
         vertex_v = edge.either()
         vertex_w = edge.other(vertex_v)
-        self.adjacency_lists[vertex_v].append(edge)
-        self.adjacency_lists[vertex_w].append(edge)
-        self.edges.append(edge)
+        index = self.number_of_edges
+
+        self.adjacency_lists[vertex_v].append(index)
+        self.adjacency_lists[vertex_w].append(index)
+        self._edge_list.append((vertex_v, vertex_w, edge.weight))
+        self.number_of_edges += 1
+        self._dirty = True
+        self._csr_dirty = True
+
+    def _build_arrays(self):
+        """
+        Builds the SoA edge arrays from the edge list.
+
+        Runs only when edges were added since the last build.
+        """
+        if not self._dirty:
+            return
+
+        edges = np.asarray(self._edge_list, dtype=np.float64).reshape(self.number_of_edges, 3)
+        self._edge_v = edges[:, 0].astype(np.int32)
+        self._edge_w = edges[:, 1].astype(np.int32)
+        self._edge_wt = np.ascontiguousarray(edges[:, 2])
+        self._dirty = False
+
+    @property
+    def edge_v(self):
+        """
+        Returns the first endpoint of every edge.
+
+        Returns:
+            numpy.ndarray: An int32 array indexed by edge number.
+        """
+        self._build_arrays()
+        return self._edge_v
+
+    @property
+    def edge_w(self):
+        """
+        Returns the second endpoint of every edge.
+
+        Returns:
+            numpy.ndarray: An int32 array indexed by edge number.
+        """
+        self._build_arrays()
+        return self._edge_w
+
+    @property
+    def edge_wt(self):
+        """
+        Returns the weight of every edge.
+
+        Returns:
+            numpy.ndarray: A float64 array indexed by edge number.
+        """
+        self._build_arrays()
+        return self._edge_wt
+
+    @property
+    def edges(self):
+        """
+        Returns WeightedEdge views of all edges in the graph.
+
+        Returns:
+            list: A list of WeightedEdge instances.
+        """
+        return [self.edge(index) for index in range(self.number_of_edges)]
+
+    def edge(self, index):
+        """
+        Returns a WeightedEdge view of the edge with the given index.
+
+        Args:
+            index (int): The edge index.
+
+        Returns:
+            WeightedEdge: A view of the edge endpoints and weight.
+        """
+        self._build_arrays()
+        return WeightedEdge(int(self._edge_v[index]), int(self._edge_w[index]),
+                            float(self._edge_wt[index]))
+
+    def other(self, index, vertex):
+        """
+        Returns the other endpoint of the edge with the given index.
+
+        Args:
+            index (int): The edge index.
+            vertex (int): One endpoint of the edge.
+
+        Returns:
+            int: The other endpoint of the edge.
+        """
+        self._build_arrays()
+        return int(self._edge_v[index] ^ self._edge_w[index] ^ vertex)
+
+    def to_csr(self):
+        """
+        Returns the adjacency structure in Compressed Sparse Row (CSR) form.
+
+        The edges incident to a vertex v occupy positions
+        adj_indptr[v]:adj_indptr[v + 1] of the flat arrays: adj_edges
+        holds the edge indices, and adj_nbr/adj_wt hold the far endpoint
+        and the weight at the same positions, so a scan streams
+        contiguous memory without gathering through the edge tables. The
+        arrays are cached and rebuilt only when edges were added since
+        the last build.
+
+        Returns:
+            tuple: A tuple (adj_indptr, adj_edges, adj_nbr, adj_wt) where
+                adj_indptr is int32 of size V + 1 and the rest are flat
+                arrays of size 2E (int32, int32 and float64).
+        """
+        if not self._csr_dirty:
+            return self._adj_indptr, self._adj_edges, self._adj_nbr, self._adj_wt
+
+        adj_indptr = np.zeros(self.number_of_vertices + 1, dtype=np.int32)
+        for vertex in range(self.number_of_vertices):
+            adj_indptr[vertex + 1] = adj_indptr[vertex] + len(self.adjacency_lists[vertex])
+
+        adj_edges = np.fromiter(
+            (index for vertex in range(self.number_of_vertices)
+             for index in self.adjacency_lists[vertex]),
+            dtype=np.int32, count=int(adj_indptr[-1]))
+
+        # Far endpoints and weights aligned with adj_edges positions
+        self._build_arrays()
+        vertex_of = np.repeat(np.arange(self.number_of_vertices, dtype=np.int32),
+                              np.diff(adj_indptr))
+        adj_nbr = self._edge_v[adj_edges] ^ self._edge_w[adj_edges] ^ vertex_of
+        adj_wt = self._edge_wt[adj_edges]
+
+        self._adj_indptr = adj_indptr
+        self._adj_edges = adj_edges
+        self._adj_nbr = adj_nbr
+        self._adj_wt = adj_wt
+        self._csr_dirty = False
+        return adj_indptr, adj_edges, adj_nbr, adj_wt
+
+    def adj_slice(self, vertex):
+        """
+        Returns a zero-copy CSR view of the edges incident to a vertex.
+
+        Args:
+            vertex (int): The vertex for which adjacent edges are to be returned.
+
+        Returns:
+            numpy.ndarray: A view into the CSR edge-index array, allocated
+                without copying.
+        """
+        adj_indptr, adj_edges, _, _ = self.to_csr()
+        return adj_edges[adj_indptr[vertex]:adj_indptr[vertex + 1]]
 
     def adjacents(self, vertex_v):
         """
-        Returns the edges adjacent to the given vertex.
-        
+        Returns the indices of the edges adjacent to the given vertex.
+
         Args:
             vertex_v (int): The vertex for which adjacent edges are to be returned.
-        
+
         Returns:
-            list: A list of edges adjacent to the given vertex.
+            list: A list of edge indices incident to the vertex.
         """
         return self.adjacency_lists[vertex_v]
 
@@ -48,10 +205,10 @@ class EdgeWeightedGraph:
     def from_file(cls, file_path):
         """
         Creates an edge-weighted graph from a file.
-        
+
         Args:
             file_path (str): The path to the file containing the graph data.
-        
+
         Returns:
             EdgeWeightedGraph: An instance of the EdgeWeightedGraph class.
         """
@@ -74,18 +231,20 @@ class EdgeWeightedGraph:
     def to_networkx_graph(self):
         """
         Converts the graph to a NetworkX graph.
-        
+
         Returns:
             networkx.Graph: A NetworkX graph representing the same edge-weighted graph.
         """
 
         # Create an empty undirected graph using NetworkX
+        self._build_arrays()
         graph = nx.Graph()
 
         # Add Edges to NetworkX Graph
-        for vertex_v in range(self.number_of_vertices):
-            for edge in self.adjacency_lists[vertex_v]:
-                graph.add_edge(edge.vertex_v, edge.vertex_w, weight=edge.weight)
+        graph.add_edges_from(
+            (int(vertex_v), int(vertex_w), {'weight': weight})
+            for vertex_v, vertex_w, weight
+            in zip(self._edge_v, self._edge_w, self._edge_wt))
         return graph
 
 
@@ -114,4 +273,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
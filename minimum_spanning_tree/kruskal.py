@@ -15,30 +15,36 @@ class KruskalMST:
         Args:
             graph (EdgeWeightedGraph): The edge-weighted graph to find the MST for.
         """
+        self._graph = graph
         self.mst = []
-        priority_queue = []
         union_find = UnionFind(graph.number_of_vertices)
 
-        for edge in graph.edges:
-            heapq.heappush(priority_queue, edge)
+        # Heapify (weight, index) tuples in one pass instead of pushing
+        # edge objects one by one; tolist() yields native floats so heap
+        # compares stay C tuple compares
+        priority_queue = list(zip(graph.edge_wt.tolist(), range(graph.number_of_edges)))
+        heapq.heapify(priority_queue)
+
+        edge_v = graph.edge_v
+        edge_w = graph.edge_w
 
         while priority_queue and len(self.mst) < graph.number_of_vertices - 1:
-            edge = heapq.heappop(priority_queue)
-            vertex_v = edge.either()
-            vertex_w = edge.other(vertex_v)
+            weight, index = heapq.heappop(priority_queue)
+            vertex_v = int(edge_v[index])
+            vertex_w = int(edge_w[index])
 
             if not union_find.connected(vertex_v, vertex_w):
                 union_find.union(vertex_v, vertex_w)
-                self.mst.append(edge)
+                self.mst.append(index)
 
     def edges(self):
         """
         Returns the edges in the Minimum Spanning Tree (MST).
-        
+
         Returns:
-            list: A list of edges in the MST.
+            list: A list of WeightedEdge views of the edges in the MST.
         """
-        return self.mst
+        return [self._graph.edge(index) for index in self.mst]
 
 
 def main():
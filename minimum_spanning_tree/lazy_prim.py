@@ -1,39 +1,75 @@
 from edge_weighted_graph import EdgeWeightedGraph
+from lazy_prim_nb import lazy_prim_mst, njit
 import heapq
 
 
 class LazyPrimMST:
     """
     Implements Lazy Prim's algorithm to find the Minimum Spanning Tree (MST) of an edge-weighted graph.
+
+    When numba is installed the whole builder runs as the compiled kernel
+    in lazy_prim_nb over CSR adjacency arrays; otherwise it falls back to
+    the interpreted heapq loop below.
     """
 
     def __init__(self, graph):
         """
         Initializes the LazyPrimMST object and computes the MST using Lazy Prim's algorithm.
-        
+
         Args:
             graph (EdgeWeightedGraph): The edge-weighted graph to find the MST for.
         """
+        self._graph = graph
         self.mst = []
         self.priority_queue = []
         self.marked = [False] * graph.number_of_vertices
 
+        if njit is not None:
+            adj_indptr, adj_edges, _, _ = graph.to_csr()
+            chosen = lazy_prim_mst(adj_indptr, adj_edges, graph.edge_v,
+                                   graph.edge_w, graph.edge_wt,
+                                   graph.number_of_vertices)
+            self.mst = [int(index) for index in chosen]
+
+            self.marked[0] = True
+            for index in self.mst:
+                self.marked[graph.edge_v[index]] = True
+                self.marked[graph.edge_w[index]] = True
+            return
+
         # Start with an arbitrary vertex
         source = 0
         self._visit(graph, source)
 
         # Process the priority queue until we have enough edges for the MST
+        edge_v = graph.edge_v
+        edge_w = graph.edge_w
+
+        # Compact the heap whenever it outgrows this; the threshold doubles
+        # after each compaction so repeated sweeps stay amortized
+        compact_threshold = 4 * graph.number_of_vertices
+
         while self.priority_queue and len(self.mst) < graph.number_of_vertices - 1:
-            edge = heapq.heappop(self.priority_queue)
-            vertex_v = edge.either()
-            vertex_w = edge.other(vertex_v)
+            # Sweep out entries whose edges already have both endpoints in
+            # the tree, so stale entries stop inflating every sift
+            if len(self.priority_queue) > compact_threshold:
+                marked = self.marked
+                self.priority_queue = [
+                    entry for entry in self.priority_queue
+                    if not (marked[edge_v[entry[1]]] and marked[edge_w[entry[1]]])]
+                heapq.heapify(self.priority_queue)
+                compact_threshold = max(compact_threshold, 2 * len(self.priority_queue))
+
+            weight, index = heapq.heappop(self.priority_queue)
+            vertex_v = edge_v[index]
+            vertex_w = edge_w[index]
 
             # Skip if both vertices are already marked
             if self.marked[vertex_v] and self.marked[vertex_w]:
                 continue
 
             # Add the edge to the MST
-            self.mst.append(edge)
+            self.mst.append(index)
 
             # Visit the vertices that are not yet marked
             if not self.marked[vertex_v]:
@@ -47,24 +83,39 @@ class LazyPrimMST:
         """
         Marks the vertex and adds all edges from this vertex
         to the priority queue if the other endpoint is not marked.
-        
+
+        Edges are pushed as (weight, index) tuples of primitives, so heap
+        compares never fall back to Python-level edge comparisons. The
+        scan walks the CSR position range of the vertex and streams the
+        flat aligned endpoint/weight arrays.
+
         Args:
             graph (EdgeWeightedGraph): The graph to visit.
             vertex (int): The vertex to mark and visit its edges.
         """
         self.marked[vertex] = True
-        for edge in graph.adjacents(vertex):
-            if not self.marked[edge.other(vertex)]:
-                heapq.heappush(self.priority_queue, edge)
+        adj_indptr, adj_edges, adj_nbr, adj_wt = graph.to_csr()
+        marked = self.marked
+
+        # tolist() yields native floats and ints, so every later heap
+        # comparison is a C tuple compare with no numpy scalar dispatch
+        start, end = adj_indptr[vertex], adj_indptr[vertex + 1]
+        neighbors = adj_nbr[start:end].tolist()
+        weights = adj_wt[start:end].tolist()
+        indices = adj_edges[start:end].tolist()
+
+        for neighbor, weight, index in zip(neighbors, weights, indices):
+            if not marked[neighbor]:
+                heapq.heappush(self.priority_queue, (weight, index))
 
     def edges(self):
         """
         Returns the edges in the Minimum Spanning Tree (MST).
-        
+
         Returns:
-            list: A list of edges in the MST.
+            list: A list of WeightedEdge views of the edges in the MST.
         """
-        return self.mst
+        return [self._graph.edge(index) for index in self.mst]
 
 
 def main():
@@ -0,0 +1,115 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    njit = None
+
+
+def lazy_prim_mst(adj_indptr, adj_edges, edge_v, edge_w, edge_wt, number_of_vertices):
+    """
+    Computes the MST edge indices with the lazy Prim algorithm over CSR arrays.
+
+    The whole builder runs on typed numpy arrays: a manual binary min-heap
+    backed by parallel key/value arrays replaces heapq, and adjacency is
+    scanned straight out of the CSR layout. When numba is installed the
+    function is compiled, so the heap compares and swaps run as native code.
+
+    Args:
+        adj_indptr (numpy.ndarray): CSR row pointers into adj_edges, int32 of size V + 1.
+        adj_edges (numpy.ndarray): Edge indices incident to each vertex, int32 of size 2E.
+        edge_v (numpy.ndarray): First endpoint of every edge, int32 of size E.
+        edge_w (numpy.ndarray): Second endpoint of every edge, int32 of size E.
+        edge_wt (numpy.ndarray): Weight of every edge, float64 of size E.
+        number_of_vertices (int): The number of vertices in the graph.
+
+    Returns:
+        numpy.ndarray: The indices of the chosen MST edges, int32.
+    """
+    marked = np.zeros(number_of_vertices, dtype=np.uint8)
+    mst = np.empty(number_of_vertices - 1, dtype=np.int32)
+    mst_size = 0
+
+    # Each edge is pushed at most once: the second endpoint to be visited
+    # always sees the first one already marked
+    heap_key = np.empty(edge_wt.shape[0] + 1, dtype=np.float64)
+    heap_val = np.empty(edge_wt.shape[0] + 1, dtype=np.int32)
+    heap_size = 0
+
+    frontier_v = 0
+    frontier_w = 0
+    marked[0] = 1
+
+    for position in range(adj_indptr[0], adj_indptr[1]):
+        index = adj_edges[position]
+        if marked[edge_v[index] ^ edge_w[index]] == 0:
+            # Push (weight, index) and sift up
+            child = heap_size
+            heap_size += 1
+            key = edge_wt[index]
+            while child > 0:
+                parent = (child - 1) >> 1
+                if heap_key[parent] <= key:
+                    break
+                heap_key[child] = heap_key[parent]
+                heap_val[child] = heap_val[parent]
+                child = parent
+            heap_key[child] = key
+            heap_val[child] = index
+
+    while heap_size > 0 and mst_size < number_of_vertices - 1:
+        # Pop the lightest crossing edge and sift the last entry down
+        best = heap_val[0]
+        heap_size -= 1
+        key = heap_key[heap_size]
+        value = heap_val[heap_size]
+        parent = 0
+        child = 1
+        while child < heap_size:
+            if child + 1 < heap_size and heap_key[child + 1] < heap_key[child]:
+                child += 1
+            if key <= heap_key[child]:
+                break
+            heap_key[parent] = heap_key[child]
+            heap_val[parent] = heap_val[child]
+            parent = child
+            child = 2 * parent + 1
+        if heap_size > 0:
+            heap_key[parent] = key
+            heap_val[parent] = value
+
+        frontier_v = edge_v[best]
+        frontier_w = edge_w[best]
+
+        # Skip entries made stale since they were pushed
+        if marked[frontier_v] == 1 and marked[frontier_w] == 1:
+            continue
+
+        mst[mst_size] = best
+        mst_size += 1
+
+        for vertex in (frontier_v, frontier_w):
+            if marked[vertex] == 0:
+                marked[vertex] = 1
+
+                for position in range(adj_indptr[vertex], adj_indptr[vertex + 1]):
+                    index = adj_edges[position]
+                    if marked[edge_v[index] ^ edge_w[index] ^ vertex] == 0:
+                        child = heap_size
+                        heap_size += 1
+                        key = edge_wt[index]
+                        while child > 0:
+                            parent = (child - 1) >> 1
+                            if heap_key[parent] <= key:
+                                break
+                            heap_key[child] = heap_key[parent]
+                            heap_val[child] = heap_val[parent]
+                            child = parent
+                        heap_key[child] = key
+                        heap_val[child] = index
+
+    return mst[:mst_size]
+
+
+if njit is not None:
+    lazy_prim_mst = njit(cache=True)(lazy_prim_mst)
@@ -1,4 +1,3 @@
-from collections import defaultdict
 from typing import Iterator, List, Set, Union
 
 
@@ -36,20 +35,21 @@ class UnionFind:
         self._id = list(range(n))
         self._size = [1] * (n) # Initialize component sizes
 
+        # Track components incrementally so queries never rescan all sites
+        self._num_components = n
+        self._component_members = {i: {i} for i in range(n)}
+
     def _components(self: 'UnionFind') -> list:
         """
         Returns the connected components in the Union Find structure.
 
+        The component map is maintained incrementally by union, so this
+        is a constant-time view rather than a rescan of every site.
+
         Returns:
-            components (list): A dictionary where keys are roots and values are sets of connected sites.
+            components (list): A list of sets of connected sites.
         """
-        components = defaultdict(set)
-
-        for i, index in enumerate(self._id):
-            root = self._root(i)
-            components[root].add(i)
-
-        return list(components.values())
+        return list(self._component_members.values())
 
     def _root(self: 'UnionFind', i: int) -> int:
         """
@@ -122,10 +122,16 @@ class UnionFind:
         if self._size[i] < self._size[j]:
             self._id[i] = j
             self._size[j] += self._size[i]
+            winner, loser = j, i
 
         else:
             self._id[j] = i
             self._size[i] += self._size[j]
+            winner, loser = i, j
+
+        # Fold the losing component into the winning one
+        self._component_members[winner] |= self._component_members.pop(loser)
+        self._num_components -= 1
 
     def __getitem__(self: 'UnionFind', index: Union[int, slice]) -> Union[Set[int], List[Set[int]]]:
         """
@@ -156,7 +162,7 @@ class UnionFind:
         Returns:
             int: The number of connected components.
         """
-        return len(self._components())
+        return self._num_components
 
     def __repr__(self: 'UnionFind') -> str:
         """
@@ -1,8 +1,13 @@
 class WeightedEdge:
     """
     Represents a weighted edge in an edge-weighted graph.
+
+    Instances are lightweight views over the SoA edge arrays owned by
+    EdgeWeightedGraph; __slots__ keeps them free of a per-instance dict.
     """
 
+    __slots__ = ('_vertex_v', '_vertex_w', '_weight')
+
     def __init__(self, vertex_v, vertex_w, weight):
         """
         Initializes a weighted edge with the specified vertices and weight.
@@ -82,7 +87,9 @@ class WeightedEdge:
         Returns:
             bool: True if this edge's weight is less than the other edge's weight, False otherwise.
         """
-        return self.weight < other.weight
+        # Read the slot directly; going through the property would add two
+        # descriptor calls to every heap comparison
+        return self._weight < other._weight
 
     def __eq__(self, other):
         """
@@ -94,7 +101,7 @@ class WeightedEdge:
         Returns:
             bool: True if the edges have the same weight, False otherwise.
         """
-        return self.weight == other.weight
+        return self._weight == other._weight
 
     def __repr__(self):
         """
@@ -1,43 +1,62 @@
+from cycle_finder import EdgeWeightedCycleFinder
 from edge_weighted_digraph import EdgeWeightedDigraph
 from topological_order import TopologicalOrder
+from array import array
+from math import inf as INF
 
 
 class AcyclicSP:
     """
     Implements the shortest path algorithm for edge-weighted directed acyclic graphs (DAGs).
+
+    Relaxing the edges in topological order settles every vertex in one
+    O(V + E) sweep with no priority queue, beating Dijkstra's
+    O(E log V) and tolerating negative weights.
     """
 
     def __init__(self, digraph, source):
         """
         Initializes the AcyclicSP object and computes the shortest path from the source vertex.
-        
+
         Args:
             digraph (EdgeWeightedDigraph): The edge-weighted directed graph.
             source (int): The source vertex from which to calculate shortest paths.
+
+        Raises:
+            ValueError: If the digraph contains a directed cycle.
         """
-        self._edge_to = [None] * digraph.number_of_vertices
-        self._dist_to = [float('inf')] * digraph.number_of_vertices
+        # Topological relaxation is only sound on a DAG; on cyclic input
+        # the sweep would silently return wrong distances
+        cycle_finder = EdgeWeightedCycleFinder(digraph)
+        if cycle_finder.has_cycle:
+            raise ValueError(f"The digraph is not acyclic, it contains the cycle {cycle_finder.get_cycle()}")
+
+        # Typed arrays of unboxed scalars; the shortest path tree stores
+        # edge indices, with -1 for no edge
+        self._digraph = digraph
+        self._edge_to = array('l', [-1] * digraph.number_of_vertices)
+        self._dist_to = array('d', [INF] * digraph.number_of_vertices)
 
         self._dist_to[source] = 0.0
         topological_sort = TopologicalOrder(digraph)
         topological_order = topological_sort.get_order()
 
+        # Relax straight off the CSR arrays: head vertex, weight and edge
+        # index are read from flat aligned storage
+        adj_indptr, adj_edges, adj_nbr, adj_wt = digraph.to_csr()
+        dist_to = self._dist_to
+        edge_to = self._edge_to
+
         for vertex in topological_order:
-            for edge in digraph.adjacents(vertex):
-                self._relax(edge)
+            distance = dist_to[vertex]
 
-    def _relax(self, edge):
-        """
-        Relaxes the edge and updates the shortest path tree if a shorter path is found.
-        
-        Args:
-            edge (WeightedEdge): The edge to be relaxed.
-        """
-        vertex_v = edge.from_edge()
-        vertex_w = edge.to_edge()
-        if self._dist_to[vertex_w] > edge.weight + self._dist_to[vertex_v]:
-            self._dist_to[vertex_w] = edge.weight + self._dist_to[vertex_v]
-            self._edge_to[vertex_w] = edge
+            for position in range(adj_indptr[vertex], adj_indptr[vertex + 1]):
+                vertex_w = adj_nbr[position]
+                candidate = adj_wt[position] + distance
+
+                if candidate < dist_to[vertex_w]:
+                    dist_to[vertex_w] = candidate
+                    edge_to[vertex_w] = adj_edges[position]
 
     def dist_to(self, vertex):
         """
@@ -61,14 +80,20 @@ class AcyclicSP:
         Returns:
             list: A list of edges representing the shortest path to the vertex.
         """
-        path = []
-        current_edge = self._edge_to[vertex]
+        # Fill a preallocated buffer from the back; a tree path holds at
+        # most V - 1 edges, so one allocation and one pass suffice
+        number_of_vertices = len(self._edge_to)
+        path = [None] * number_of_vertices
+        position = number_of_vertices
+        index = self._edge_to[vertex]
 
-        while current_edge:
-            path.append(current_edge)
-            current_edge = self._edge_to[current_edge.from_edge()]
+        while index >= 0:
+            current_edge = self._digraph.edge(index)
+            position -= 1
+            path[position] = current_edge
+            index = self._edge_to[current_edge.from_edge()]
 
-        return list(reversed(path))
+        return path[position:]
 
 
 def main():
@@ -1,90 +1,221 @@
-from edge_weighted_digraph import EdgeWeightedDigraph
-from cycle_finder import EdgeWeightedCycleFinder
+from array import array
 from collections import deque
+from edge_weighted_digraph import EdgeWeightedDigraph
+from sssp_nb import bellman_ford_sssp, njit
+import numpy as np
+from math import inf as INF
 
 
 class BellmanFord:
     """
-    Queue-based implementation of the Bellman-Ford algorithm to find the shortest path
+    Vectorized implementation of the Bellman-Ford algorithm to find the shortest path
     in an edge-weighted directed graph and to detect negative weight cycles.
+
+    When numba is installed the passes run as the compiled kernel in
+    sssp_nb, a tight scalar sweep over the SoA edge arrays. Otherwise
+    each round relaxes every edge at once over flat numpy arrays instead
+    of looping per edge in Python. Both stop as soon as a round makes no
+    improvement.
     """
 
     def __init__(self, digraph, source):
         """
-        Initializes the BellmanFord object and computes the shortest path from the source vertex using a queue-based implementation.
-        
+        Initializes the BellmanFord object and computes the shortest path from the source vertex
+        using vectorized edge-scan relaxation.
+
         Args:
             digraph (EdgeWeightedDigraph): The edge-weighted directed graph.
             source (int): The source vertex from which to calculate shortest paths.
         """
-        self._edge_to = [None] * digraph.number_of_vertices
-        self._dist_to = [float('inf')] * digraph.number_of_vertices
-        self._on_queue = [False] * digraph.number_of_vertices
-        self._cost = 0
+        self._digraph = digraph
+        self._edge_to = np.full(digraph.number_of_vertices, -1, dtype=np.int32)
+        self._dist_to = np.full(digraph.number_of_vertices, np.inf)
         self._cycle = None
 
-        self._queue = deque([source])
         self._dist_to[source] = 0.0
-        self._on_queue[source] = True
 
-        while self._queue and not self.has_negative_cycle:
-            vertex_v = self._queue.popleft()
-            self._on_queue[vertex_v] = False
-            self._relax(digraph, vertex_v)
+        # Flat edge arrays come straight from the graph's SoA storage
+        edge_v = digraph.edge_v
+        edge_w = digraph.edge_w
+        edge_wt = digraph.edge_wt
+
+        if njit is not None:
+            self._dist_to, self._edge_to, improved = bellman_ford_sssp(
+                edge_v, edge_w, edge_wt, digraph.number_of_vertices, source)
+
+            if improved:
+                self._find_negative_cycle(digraph)
+            return
+
+        dist_to = self._dist_to
+        improved = False
+
+        # Blocked layout: each slice scatters its dist_to writes into one
+        # cache-resident window of head vertices instead of the whole array
+        block_indptr, edge_idx, edge_v, edge_w, edge_wt = digraph.to_blocked_csr()
+        blocks = [(edge_idx[start:end], edge_v[start:end],
+                   edge_w[start:end], edge_wt[start:end])
+                  for start, end in zip(block_indptr[:-1], block_indptr[1:])
+                  if end > start]
+
+        # V rounds of whole-edge-list relaxation, plus one extra round:
+        # any improvement on round V + 1 proves a negative cycle
+        for _ in range(digraph.number_of_vertices + 1):
+            improved = False
+
+            for block_idx, block_v, block_w, block_wt in blocks:
+                candidate = dist_to[block_v] + block_wt
+                hits = np.flatnonzero(candidate < dist_to[block_w])
+
+                if hits.size == 0:
+                    continue
+
+                improved = True
+                heads = block_w[hits]
+                candidates = candidate[hits]
+                np.minimum.at(dist_to, heads, candidates)
+
+                # Record only the edges that achieve the new distance, so
+                # the shortest path tree stays consistent with dist_to
+                winners = hits[candidates == dist_to[heads]]
+                self._edge_to[block_w[winners]] = block_idx[winners]
+
+            if not improved:
+                break
+
+        if improved:
+            self._find_negative_cycle(digraph)
+
+    @classmethod
+    def spfa(cls, digraph, source):
+        """
+        Computes the shortest path with the queue-based SPFA variant.
+
+        Instead of relaxing every edge V times, only vertices whose
+        distance changed since they were last processed are kept in a
+        FIFO queue, so edges out of unreached or settled vertices are
+        never scanned. Worst case matches Bellman-Ford, but on typical
+        sparse graphs most vertices are processed only a few times. A
+        vertex relaxed V or more times proves a negative cycle, which
+        replaces the separate extra relaxation round.
+
+        Args:
+            digraph (EdgeWeightedDigraph): The edge-weighted directed graph.
+            source (int): The source vertex from which to calculate shortest paths.
+
+        Returns:
+            BellmanFord: An instance holding the computed shortest paths.
+        """
+        self = cls.__new__(cls)
+        number_of_vertices = digraph.number_of_vertices
+        self._digraph = digraph
+
+        # Typed arrays of unboxed scalars; -1 marks vertices with no tree edge
+        self._edge_to = array('l', [-1] * number_of_vertices)
+        self._dist_to = array('d', [INF] * number_of_vertices)
+        self._cycle = None
+
+        dist_to = self._dist_to
+        edge_to = self._edge_to
+        dist_to[source] = 0.0
+
+        adj_indptr, adj_edges, adj_nbr, adj_wt = digraph.to_csr()
+        queue = deque([source])
+
+        # Byte flags answer "is it queued?" in O(1) without scanning the
+        # queue; relax counts bound the work and expose negative cycles
+        in_queue = bytearray(number_of_vertices)
+        in_queue[source] = 1
+        relax_count = [0] * number_of_vertices
+
+        while queue:
+            vertex = queue.popleft()
+            in_queue[vertex] = 0
+            distance = dist_to[vertex]
+
+            start, end = adj_indptr[vertex], adj_indptr[vertex + 1]
+            neighbors = adj_nbr[start:end].tolist()
+            weights = adj_wt[start:end].tolist()
+            indices = adj_edges[start:end].tolist()
+
+            for vertex_w, weight, index in zip(neighbors, weights, indices):
+                candidate = distance + weight
+
+                if candidate < dist_to[vertex_w]:
+                    dist_to[vertex_w] = candidate
+                    edge_to[vertex_w] = index
+
+                    if not in_queue[vertex_w]:
+                        relax_count[vertex_w] += 1
+
+                        # A vertex requeued V times sits on or behind a
+                        # negative cycle; the parent pointers contain it
+                        if relax_count[vertex_w] >= number_of_vertices:
+                            self._find_negative_cycle(digraph)
+                            return self
+
+                        queue.append(vertex_w)
+                        in_queue[vertex_w] = 1
+
+        return self
 
     @property
     def has_negative_cycle(self):
         """
         Checks if the graph has a negative weight cycle.
-        
+
         Returns:
             bool: True if the graph has a negative weight cycle, False otherwise.
         """
         return self._cycle is not None
 
-    def _relax(self, digraph, vertex_v):
+    def _find_negative_cycle(self, digraph):
         """
-        Relaxes the edges and updates the shortest path tree if a shorter path is found.
-        
+        Recovers the negative weight cycle from the shortest path tree.
+
+        Runs once, only after the extra relaxation round still improved a
+        distance, so the tree is guaranteed to contain a cycle. The cycle
+        is found by walking the parent pointers in _edge_to directly,
+        stamping each vertex with the walk that reached it, so no subgraph
+        is built and no DFS machinery runs.
+
         Args:
-            digraph (EdgeWeightedDigraph): The edge-weighted directed graph.
-            vertex_v (int): The vertex being relaxed.
+            digraph (EdgeWeightedDigraph): The edge-weighted directed graph to check for negative cycles.
         """
-        for edge in digraph.adjacents(vertex_v):
-            vertex_w = edge.to_edge()
+        visited = [-1] * digraph.number_of_vertices
+        edge_v = digraph.edge_v
 
-            if self._dist_to[vertex_w] > edge.weight + self._dist_to[vertex_v]:
-                self._dist_to[vertex_w] = edge.weight + self._dist_to[vertex_v]
-                self._edge_to[vertex_w] = edge
+        for start in range(digraph.number_of_vertices):
+            vertex = start
 
-                if not self._on_queue[vertex_w]:
-                    self._queue.append(vertex_w)
-                    self._on_queue[vertex_w] = True
+            # Chase parent pointers until the walk leaves the tree or
+            # reaches a vertex seen by this or an earlier walk
+            while vertex != -1 and visited[vertex] == -1:
+                visited[vertex] = start
+                index = self._edge_to[vertex]
+                vertex = int(edge_v[index]) if index >= 0 else -1
 
-            self._cost += 1
+            # Revisiting a vertex stamped by this same walk closes a cycle
+            if vertex != -1 and visited[vertex] == start:
+                cycle = [vertex]
+                current = int(edge_v[self._edge_to[vertex]])
 
-            if self._cost % digraph.number_of_vertices == 0:
-                self._find_negative_cycle(digraph)
+                while current != vertex:
+                    cycle.append(current)
+                    current = int(edge_v[self._edge_to[current]])
 
-    def _find_negative_cycle(self, digraph):
-        """
-        Detects if the graph contains a negative weight cycle.
-        
-        Args:
-            digraph (EdgeWeightedDigraph): The edge-weighted directed graph to check for negative cycles.
-        """
-        subgraph = EdgeWeightedDigraph(digraph.number_of_vertices)
-        for edge in self._edge_to:
-            if edge is not None:
-                subgraph.add_edge(edge)
+                cycle.append(vertex)
 
-        cycle_finder = EdgeWeightedCycleFinder(subgraph)
-        self._cycle = cycle_finder.get_cycle()
+                # Parent pointers run backwards; one in-place reverse
+                # orients the cycle without allocating a second list
+                cycle.reverse()
+                self._cycle = cycle
+                return
 
     def negative_cycle(self):
         """
         Returns the detected negative cycle.
-        
+
         Returns:
             list: A list of edges representing the negative cycle, if a cycle exists.
             None: If no cycle exists.
@@ -94,49 +225,55 @@ class BellmanFord:
     def dist_to(self, vertex):
         """
         Returns the shortest distance to the given vertex.
-        
+
         Args:
             vertex (int): The target vertex.
-        
+
         Returns:
             float: The shortest distance to the vertex if no negative cycle exists, float('inf') otherwise.
         """
         if not self.has_negative_cycle:
-            return self._dist_to[vertex]
+            return float(self._dist_to[vertex])
         else:
-            return float('inf')
+            return INF
 
     def has_path_to(self, vertex):
         """
         Checks if there is a path to the given vertex.
-        
+
         Args:
             vertex (int): The target vertex.
-        
+
         Returns:
             bool: True if there is a path to the vertex, False otherwise.
         """
-        return self._dist_to[vertex] < float('inf')
+        return self._dist_to[vertex] < INF
 
     def path_to(self, vertex):
         """
         Returns the shortest path to the given vertex.
-        
+
         Args:
             vertex (int): The target vertex.
-        
+
         Returns:
             list: A list of edges representing the shortest path to the vertex if no negative cycle exists, None otherwise.
         """
         if not self.has_negative_cycle:
-            path = []
-            current_edge = self._edge_to[vertex]
+            # Fill a preallocated buffer from the back; a tree path holds
+            # at most V - 1 edges, so one allocation and one pass suffice
+            number_of_vertices = len(self._edge_to)
+            path = [None] * number_of_vertices
+            position = number_of_vertices
+            index = self._edge_to[vertex]
 
-            while current_edge:
-                path.append(current_edge)
-                current_edge = self._edge_to[current_edge.from_edge()]
+            while index >= 0:
+                current_edge = self._digraph.edge(index)
+                position -= 1
+                path[position] = current_edge
+                index = self._edge_to[current_edge.from_edge()]
 
-            return list(reversed(path))
+            return path[position:]
 
         else:
             return None
@@ -145,7 +282,7 @@ class BellmanFord:
 def main():
     """
     Main function to read an edge-weighted directed graph from a file and compute
-    the shortest path using the queue-based Bellman-Ford algorithm.
+    the shortest path using the vectorized Bellman-Ford algorithm.
     """
 
     FILE_PATH = "data/ewd.txt"
@@ -159,6 +296,9 @@ def main():
     print(f"Distance from {source} to {vertex}: {bellman_ford.dist_to(vertex)}")
     print(f"Shortest path from {source} to {vertex}: {bellman_ford.path_to(vertex)}")
 
+    spfa = BellmanFord.spfa(digraph, source)
+    print(f"Distance from {source} to {vertex} (SPFA): {spfa.dist_to(vertex)}")
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
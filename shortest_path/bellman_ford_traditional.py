@@ -1,4 +1,5 @@
 from edge_weighted_digraph import EdgeWeightedDigraph
+from math import inf as INF
 
 
 class BellmanFord:
@@ -16,18 +17,39 @@ class BellmanFord:
             source (int): The source vertex from which to calculate shortest paths.
         """
         self._edge_to = [None] * digraph.number_of_vertices
-        self._dist_to = [float('inf')] * digraph.number_of_vertices
+        self._dist_to = [INF] * digraph.number_of_vertices
         self._has_negative_cycle = False
 
         self._dist_to[source] = 0.0
 
-        for _ in range(digraph.number_of_vertices):
-            for vertex in range(digraph.number_of_vertices):
-                for edge in digraph.adjacents(vertex):
-                    self._relax(edge)
+        # Materialize the edge views once; each pass sweeps the flat list.
+        # V - 1 passes settle every shortest path, so the V-th pass doubles
+        # as the negative-cycle probe: a relaxation succeeding there proves
+        # a cycle, and a pass that changes nothing ends the loop early
+        edges = digraph.edges
+
+        # Local bindings keep the inlined relaxation free of attribute
+        # lookups and method dispatch in the V * E hot loop
+        dist_to = self._dist_to
+        edge_to = self._edge_to
+
+        changed = True
+        for round_number in range(digraph.number_of_vertices):
+            if not changed:
+                break
+
+            changed = False
+            for edge in edges:
+                candidate = edge.weight + dist_to[edge.from_edge()]
+                vertex_w = edge.to_edge()
+
+                if candidate < dist_to[vertex_w]:
+                    dist_to[vertex_w] = candidate
+                    edge_to[vertex_w] = edge
+                    changed = True
 
-        # Check for negative weight cycles
-        self._detect_negative_cycle(digraph)
+            if changed and round_number == digraph.number_of_vertices - 1:
+                self._has_negative_cycle = True
 
     @property
     def has_negative_cycle(self):
@@ -40,36 +62,6 @@ class BellmanFord:
         return self._has_negative_cycle
     
 
-    def _relax(self, edge):
-        """
-        Relaxes the edge and updates the shortest path tree if a shorter path is found.
-        
-        Args:
-            edge (WeightedEdge): The edge to be relaxed.
-        """
-        vertex_v = edge.from_edge()
-        vertex_w = edge.to_edge()
-        if self._dist_to[vertex_w] > edge.weight + self._dist_to[vertex_v]:
-            self._dist_to[vertex_w] = edge.weight + self._dist_to[vertex_v]
-            self._edge_to[vertex_w] = edge
-
-    def _detect_negative_cycle(self, digraph):
-        """
-        Detects if the graph contains a negative weight cycle.
-        
-        Args:
-            digraph (EdgeWeightedDigraph): The edge-weighted directed graph to check for negative cycles.
-        """
-
-        # If there is any edge that needs to be relaxed, then there is a negative cycle
-        for vertex in range(digraph.number_of_vertices):
-            for edge in digraph.adjacents(vertex):
-                vertex_v = edge.from_edge()
-                vertex_w = edge.to_edge()
-                if self._dist_to[vertex_w] > edge.weight + self._dist_to[vertex_v]:
-                    self._has_negative_cycle = True
-                    return
-
     def dist_to(self, vertex):
         """
         Returns the shortest distance to the given vertex.
@@ -95,7 +87,7 @@ class BellmanFord:
         Returns:
             bool: True if there is a path to the vertex, False otherwise.
         """
-        return self._dist_to[vertex] < float('inf')
+        return self._dist_to[vertex] < INF
 
     def path_to(self, vertex):
         """
@@ -108,14 +100,19 @@ class BellmanFord:
             list: A list of edges representing the shortest path to the vertex if no negative cycle exists, None otherwise.
         """
         if not self.has_negative_cycle:
-            path = []
+            # Fill a preallocated buffer from the back; a tree path holds
+            # at most V - 1 edges, so one allocation and one pass suffice
+            number_of_vertices = len(self._edge_to)
+            path = [None] * number_of_vertices
+            position = number_of_vertices
             current_edge = self._edge_to[vertex]
 
             while current_edge:
-                path.append(current_edge)
+                position -= 1
+                path[position] = current_edge
                 current_edge = self._edge_to[current_edge.from_edge()]
 
-            return list(reversed(path))
+            return path[position:]
 
         else:
             return None
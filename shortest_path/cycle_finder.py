@@ -14,8 +14,9 @@ class EdgeWeightedCycleFinder:
         Args:
             graph (EdgeWeightedDigraph): The edge-weighted directed graph to check for cycles.
         """
-        self.marked = [False] * graph.number_of_vertices
-        self.on_stack = [False] * graph.number_of_vertices
+        # Byte flags pack one vertex per byte instead of one pointer each
+        self.marked = bytearray(graph.number_of_vertices)
+        self.on_stack = bytearray(graph.number_of_vertices)
         self.edge_to = [None] * graph.number_of_vertices
         self.cycle = deque()
 
@@ -37,29 +38,46 @@ class EdgeWeightedCycleFinder:
 
     def _dfs(self, graph, vertex_v):
         """
-        Recursively performs DFS to detect cycles in the graph.
-        
+        Iteratively performs DFS to detect cycles in the graph.
+
+        An explicit stack of (vertex, edge iterator) pairs replaces the
+        call stack, so the traversal costs no Python frames and handles
+        paths deeper than the recursion limit. A vertex leaves the
+        on_stack set when its iterator is exhausted, exactly where the
+        recursive version returned.
+
         Args:
             graph (EdgeWeightedDigraph): The directed graph to check.
             vertex_v (int): The current vertex being visited.
         """
-        self.marked[vertex_v] = True
-        self.on_stack[vertex_v] = True
+        marked = self.marked
+        on_stack = self.on_stack
+        edge_w = graph.edge_w
 
-        for edge in graph.adjacency_lists[vertex_v]:
-            if self.has_cycle:
-                return
+        marked[vertex_v] = 1
+        on_stack[vertex_v] = 1
+        stack = [(vertex_v, iter(graph.adjacency_lists[vertex_v]))]
+
+        while stack:
+            current, edge_iterator = stack[-1]
+            index = next(edge_iterator, None)
 
-            vertex_w = edge.to_edge()
+            if index is None:
+                stack.pop()
+                on_stack[current] = 0
+                continue
 
-            if not self.marked[vertex_w]:
-                self.edge_to[vertex_w] = vertex_v
-                self._dfs(graph, vertex_w)
+            vertex_w = int(edge_w[index])
 
-            elif self.on_stack[vertex_w]:
-                self._get_cycle_path(vertex_v, vertex_w)
+            if not marked[vertex_w]:
+                self.edge_to[vertex_w] = current
+                marked[vertex_w] = 1
+                on_stack[vertex_w] = 1
+                stack.append((vertex_w, iter(graph.adjacency_lists[vertex_w])))
 
-        self.on_stack[vertex_v] = False
+            elif on_stack[vertex_w]:
+                self._get_cycle_path(current, vertex_w)
+                return
 
     def _get_cycle_path(self, vertex, adjacent):
         """
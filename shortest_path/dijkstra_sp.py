@@ -1,50 +1,201 @@
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from edge_weighted_digraph import EdgeWeightedDigraph
-from utils.index_min_pq import IndexMinPQ
+from math import inf as INF
+from sssp_nb import dijkstra_sssp, njit
+from utils.radix_heap import RadixHeap
+import heapq
+import numpy as np
 
 
 class DijkstraSP:
     """
     Implements Dijkstra's algorithm to find the shortest path in an edge-weighted directed graph.
+
+    When numba is installed the whole solver runs as the compiled kernel
+    in sssp_nb over CSR adjacency arrays. Otherwise, graphs whose weights
+    are all non-negative integers are solved with a monotone radix heap,
+    which pops in O(1) amortized without sift comparisons, and other
+    graphs use a heapq priority queue with lazy deletion, whose C-level
+    pushes and pops beat an interpreted indexed heap even though stale
+    entries cost O(E) queue slots instead of O(V).
     """
 
     def __init__(self, digraph, source):
         """
         Initializes the DijkstraSP object and computes the shortest path from the source vertex.
-        
+
         Args:
             digraph (EdgeWeightedDigraph): The edge-weighted directed graph.
             source (int): The source vertex from which to calculate shortest paths.
         """
-        self._edge_to = [None] * digraph.number_of_vertices
-        self._dist_to = [float('inf')] * digraph.number_of_vertices
-        self._priority_queue = IndexMinPQ(digraph.number_of_vertices)
+        self._digraph = digraph
+
+        # Typed arrays of unboxed scalars; -1 marks vertices with no tree
+        # edge. Indexing yields native floats and ints, so the heap loops
+        # below never touch numpy scalar dispatch
+        self._edge_to = array('l', [-1] * digraph.number_of_vertices)
+        self._dist_to = array('d', [INF] * digraph.number_of_vertices)
 
         self._dist_to[source] = 0.0
-        self._priority_queue.insert(source, self._dist_to[source])
 
-        while self._priority_queue:
-            vertex = self._priority_queue.del_min()
+        # When every weight is the same non-negative constant, shortest
+        # means fewest edges: plain BFS settles each vertex on first
+        # visit in O(V + E) with no priority queue at all
+        edge_wt = digraph.edge_wt
+        if digraph.number_of_edges == 0 or (np.ptp(edge_wt) == 0 and edge_wt[0] >= 0):
+            self._bfs(digraph, source)
+            return
+
+        if njit is not None:
+            adj_indptr, adj_edges, adj_nbr, adj_wt = digraph.to_csr()
+            dist_to, edge_to = dijkstra_sssp(adj_indptr, adj_edges, adj_nbr, adj_wt,
+                                             digraph.number_of_vertices, source)
+            self._dist_to = array('d', dist_to.tolist())
+            self._edge_to = array('l', edge_to.tolist())
+            return
+
+        # Integer weights admit the monotone radix heap fast path
+        if all(edge.weight >= 0 and edge.weight == int(edge.weight)
+               for edge in digraph.edges):
+            self._dijkstra_radix(digraph, source)
+            return
+
+        dist_to = self._dist_to
+        edge_to = self._edge_to
+        adj_indptr, adj_edges, adj_nbr, adj_wt = digraph.to_csr()
+        priority_queue = [(0.0, source)]
+
+        while priority_queue:
+            distance, vertex = heapq.heappop(priority_queue)
+
+            # Lazy deletion: skip entries made stale by a later, cheaper one
+            if distance > dist_to[vertex]:
+                continue
+
+            # tolist() yields native floats and ints, so every later heap
+            # comparison is a C tuple compare with no numpy scalar dispatch
+            start, end = adj_indptr[vertex], adj_indptr[vertex + 1]
+            neighbors = adj_nbr[start:end].tolist()
+            weights = adj_wt[start:end].tolist()
+            indices = adj_edges[start:end].tolist()
+
+            for vertex_w, weight, index in zip(neighbors, weights, indices):
+                candidate = distance + weight
+
+                if candidate < dist_to[vertex_w]:
+                    dist_to[vertex_w] = candidate
+                    edge_to[vertex_w] = index
+                    heapq.heappush(priority_queue, (candidate, vertex_w))
+
+    def _bfs(self, digraph, source):
+        """
+        Computes shortest paths by breadth-first search.
 
-            for edge in digraph.adjacents(vertex):
-                self._relax(edge)
+        Sound only when every edge carries the same non-negative weight:
+        the first visit of a vertex then uses the fewest possible edges,
+        so its distance is final the moment it is enqueued.
 
-    def _relax(self, edge):
+        Args:
+            digraph (EdgeWeightedDigraph): The edge-weighted directed graph.
+            source (int): The source vertex from which to calculate shortest paths.
         """
-        Relaxes the edge and updates the shortest path tree if a shorter path is found.
-        
+        dist_to = self._dist_to
+        edge_to = self._edge_to
+        adj_indptr, adj_edges, adj_nbr, adj_wt = digraph.to_csr()
+        queue = deque([source])
+
+        while queue:
+            vertex = queue.popleft()
+            distance = dist_to[vertex]
+
+            start, end = adj_indptr[vertex], adj_indptr[vertex + 1]
+            neighbors = adj_nbr[start:end].tolist()
+            weights = adj_wt[start:end].tolist()
+            indices = adj_edges[start:end].tolist()
+
+            for vertex_w, weight, index in zip(neighbors, weights, indices):
+                if dist_to[vertex_w] == INF:
+                    dist_to[vertex_w] = distance + weight
+                    edge_to[vertex_w] = index
+                    queue.append(vertex_w)
+
+    @classmethod
+    def multi_source(cls, digraph, sources):
+        """
+        Computes shortest paths from several source vertices in parallel.
+
+        Every run is independent: it reads the shared, immutable CSR
+        arrays and writes its own distance and parent arrays, so the
+        sources are farmed out to a thread pool. The numba kernel is
+        compiled with nogil, so the threads genuinely overlap; without
+        numba the sources are solved sequentially, since threads cannot
+        overlap interpreted bytecode.
+
         Args:
-            edge (WeightedEdge): The edge to be relaxed.
+            digraph (EdgeWeightedDigraph): The edge-weighted directed graph.
+            sources (list): The source vertices to solve from.
+
+        Returns:
+            list: A DijkstraSP instance per source, in the given order.
         """
-        vertex_v = edge.from_edge()
-        vertex_w = edge.to_edge()
-        if self._dist_to[vertex_w] > edge.weight + self._dist_to[vertex_v]:
-            self._dist_to[vertex_w] = edge.weight + self._dist_to[vertex_v]
-            self._edge_to[vertex_w] = edge
+        if njit is None:
+            return [cls(digraph, source) for source in sources]
+
+        adj_indptr, adj_edges, adj_nbr, adj_wt = digraph.to_csr()
+        number_of_vertices = digraph.number_of_vertices
+
+        def solve(source):
+            dist_to, edge_to = dijkstra_sssp(adj_indptr, adj_edges, adj_nbr, adj_wt,
+                                             number_of_vertices, source)
+            instance = cls.__new__(cls)
+            instance._digraph = digraph
+            instance._dist_to = array('d', dist_to.tolist())
+            instance._edge_to = array('l', edge_to.tolist())
+            return instance
 
-            if self._priority_queue.contains(vertex_w):
-                self._priority_queue.decrease_key(vertex_w, self._dist_to[vertex_w])
-            else:
-                self._priority_queue.insert(vertex_w, self._dist_to[vertex_w])
+        with ThreadPoolExecutor() as executor:
+            return list(executor.map(solve, sources))
+
+    def _dijkstra_radix(self, digraph, source):
+        """
+        Runs Dijkstra's algorithm over a monotone radix heap.
+
+        Distances popped by Dijkstra never decrease, which is exactly the
+        monotone contract the radix heap requires. Stale entries are
+        skipped on pop instead of being decreased in place.
+
+        Args:
+            digraph (EdgeWeightedDigraph): The edge-weighted directed graph.
+            source (int): The source vertex from which to calculate shortest paths.
+        """
+        dist_to = self._dist_to
+        edge_to = self._edge_to
+        adj_indptr, adj_edges, adj_nbr, adj_wt = digraph.to_csr()
+
+        heap = RadixHeap()
+        heap.push(0, source)
+
+        while heap:
+            distance, vertex = heap.pop()
+
+            # Lazy deletion: skip entries made stale by a later, cheaper one
+            if distance > dist_to[vertex]:
+                continue
+
+            start, end = adj_indptr[vertex], adj_indptr[vertex + 1]
+            neighbors = adj_nbr[start:end].tolist()
+            weights = adj_wt[start:end].tolist()
+            indices = adj_edges[start:end].tolist()
+
+            for vertex_w, weight, index in zip(neighbors, weights, indices):
+                candidate = distance + weight
+
+                if candidate < dist_to[vertex_w]:
+                    dist_to[vertex_w] = candidate
+                    edge_to[vertex_w] = index
+                    heap.push(int(candidate), vertex_w)
 
     def dist_to(self, vertex):
         """
@@ -68,14 +219,20 @@ class DijkstraSP:
         Returns:
             list: A list of edges representing the shortest path to the vertex.
         """
-        path = []
-        current_edge = self._edge_to[vertex]
-
-        while current_edge:
-            path.append(current_edge)
-            current_edge = self._edge_to[current_edge.from_edge()]
-
-        return list(reversed(path))
+        # Fill a preallocated buffer from the back; a tree path holds
+        # at most V - 1 edges, so one allocation and one pass suffice
+        number_of_vertices = len(self._edge_to)
+        path = [None] * number_of_vertices
+        position = number_of_vertices
+        index = self._edge_to[vertex]
+
+        while index >= 0:
+            current_edge = self._digraph.edge(index)
+            position -= 1
+            path[position] = current_edge
+            index = self._edge_to[current_edge.from_edge()]
+
+        return path[position:]
 
 
 def main():
@@ -1,87 +1,307 @@
 from directed_edge import WeightedEdge
+from io import StringIO
 import networkx as nx
 import matplotlib.pyplot as plt
+import numpy as np
 
 
 class EdgeWeightedDigraph:
     """
-    Represents an edge-weighted directed graph using adjacency lists.
+    Represents an edge-weighted directed graph using Structure-of-Arrays edge storage.
+
+    Edges live in parallel numpy arrays (edge_v, edge_w, edge_wt) indexed
+    by edge number, the adjacency lists hold edge indices, and to_csr()
+    exposes the out-edges of every vertex as contiguous Compressed Sparse
+    Row arrays, so the shortest path algorithms scan packed data instead
+    of chasing per-edge Python objects. WeightedEdge remains as a
+    lightweight view built on demand.
     """
 
     def __init__(self, number_of_vertices):
         """
         Initializes an edge-weighted directed graph with the specified number of vertices.
-        
+
         Args:
             number_of_vertices (int): The number of vertices in the graph.
+
+        Raises:
+            ValueError: If the vertex count does not fit the int32 arrays.
         """
+        # Vertex ids and edge indices live in int32 arrays throughout
+        if number_of_vertices >= 2 ** 31:
+            raise ValueError("The number of vertices must fit in int32")
+
         self.number_of_vertices = number_of_vertices
-        self.adjacency_lists = {vertex: [] for vertex in range(self.number_of_vertices)}
-        self.edges = []
+        # A dense list-of-lists: vertices are 0..V - 1, so indexing needs
+        # no hashing the way a dict keyed by vertex would
+        self.adjacency_lists = [[] for _ in range(self.number_of_vertices)]
+        self.number_of_edges = 0
+
+        # _edge_list only buffers edges added since the last array build;
+        # the SoA arrays below are the sole full copy of the edge set
+        self._edge_list = []
+        self._edge_v = np.empty(0, dtype=np.int32)
+        self._edge_w = np.empty(0, dtype=np.int32)
+        self._edge_wt = np.empty(0)
+        self._dirty = False
+        self._csr_dirty = True
+        self._blocked_dirty = True
 
     def add_edge(self, edge):
         """
         Adds a weighted edge to the graph.
-        
+
         Args:
             edge (WeightedEdge): The edge to be added to the graph.
         """
         vertex_v = edge.from_edge()
-        self.adjacency_lists[vertex_v].append(edge)
-        self.edges.append(edge)
+        index = self.number_of_edges
+
+        self.adjacency_lists[vertex_v].append(index)
+        self._edge_list.append((vertex_v, edge.to_edge(), edge.weight))
+        self.number_of_edges += 1
+        self._dirty = True
+        self._csr_dirty = True
+        self._blocked_dirty = True
+
+    def _build_arrays(self):
+        """
+        Appends the buffered edges to the SoA edge arrays.
+
+        Runs only when edges were added since the last build, and drains
+        the buffer afterwards so the tuples are not kept alive as a
+        second copy of the edge set.
+        """
+        if not self._dirty:
+            return
+
+        pending = np.asarray(self._edge_list, dtype=np.float64).reshape(len(self._edge_list), 3)
+        self._edge_v = np.concatenate((self._edge_v, pending[:, 0].astype(np.int32)))
+        self._edge_w = np.concatenate((self._edge_w, pending[:, 1].astype(np.int32)))
+        self._edge_wt = np.concatenate((self._edge_wt, pending[:, 2]))
+        self._edge_list = []
+        self._dirty = False
+
+    @property
+    def edge_v(self):
+        """
+        Returns the tail (source) vertex of every edge.
+
+        Returns:
+            numpy.ndarray: An int32 array indexed by edge number.
+        """
+        self._build_arrays()
+        return self._edge_v
+
+    @property
+    def edge_w(self):
+        """
+        Returns the head (destination) vertex of every edge.
+
+        Returns:
+            numpy.ndarray: An int32 array indexed by edge number.
+        """
+        self._build_arrays()
+        return self._edge_w
+
+    @property
+    def edge_wt(self):
+        """
+        Returns the weight of every edge.
+
+        Returns:
+            numpy.ndarray: A float64 array indexed by edge number.
+        """
+        self._build_arrays()
+        return self._edge_wt
+
+    @property
+    def edges(self):
+        """
+        Returns WeightedEdge views of all edges in the graph.
+
+        Returns:
+            list: A list of WeightedEdge instances.
+        """
+        return [self.edge(index) for index in range(self.number_of_edges)]
+
+    def edge(self, index):
+        """
+        Returns a WeightedEdge view of the edge with the given index.
+
+        Args:
+            index (int): The edge index.
+
+        Returns:
+            WeightedEdge: A view of the edge endpoints and weight.
+        """
+        self._build_arrays()
+        return WeightedEdge(int(self._edge_v[index]), int(self._edge_w[index]),
+                            float(self._edge_wt[index]))
+
+    def to_csr(self):
+        """
+        Returns the out-adjacency structure in Compressed Sparse Row (CSR) form.
+
+        The out-edges of a vertex v occupy positions
+        adj_indptr[v]:adj_indptr[v + 1] of the flat arrays: adj_edges
+        holds the edge indices, and adj_nbr/adj_wt hold the head vertex
+        and the weight at the same positions, so a relaxation scan
+        streams contiguous memory. The arrays are cached and rebuilt only
+        when edges were added since the last build.
+
+        Returns:
+            tuple: A tuple (adj_indptr, adj_edges, adj_nbr, adj_wt) where
+                adj_indptr is int32 of size V + 1 and the rest are flat
+                arrays of size E (int32, int32 and float64).
+        """
+        if not self._csr_dirty:
+            return self._adj_indptr, self._adj_edges, self._adj_nbr, self._adj_wt
+
+        adj_indptr = np.zeros(self.number_of_vertices + 1, dtype=np.int32)
+        for vertex in range(self.number_of_vertices):
+            adj_indptr[vertex + 1] = adj_indptr[vertex] + len(self.adjacency_lists[vertex])
+
+        adj_edges = np.fromiter(
+            (index for vertex in range(self.number_of_vertices)
+             for index in self.adjacency_lists[vertex]),
+            dtype=np.int32, count=int(adj_indptr[-1]))
+
+        # Head vertices and weights aligned with adj_edges positions
+        self._build_arrays()
+        adj_nbr = self._edge_w[adj_edges]
+        adj_wt = self._edge_wt[adj_edges]
+
+        self._adj_indptr = adj_indptr
+        self._adj_edges = adj_edges
+        self._adj_nbr = adj_nbr
+        self._adj_wt = adj_wt
+        self._csr_dirty = False
+        return adj_indptr, adj_edges, adj_nbr, adj_wt
+
+    def to_blocked_csr(self, block_size=32768):
+        """
+        Returns the edge arrays reordered into head-vertex blocks.
+
+        Edges are grouped by head-vertex block of block_size vertices
+        (stably, so file order survives within a block). A relaxation
+        sweep that processes one block at a time confines its scattered
+        dist_to writes to a block-sized window that stays cache-resident,
+        instead of striding the whole distance array; the default block
+        covers 32768 float64 slots, a quarter megabyte. The arrays are
+        cached per block size and rebuilt only when edges were added.
+
+        Args:
+            block_size (int): The number of head vertices per block.
+
+        Returns:
+            tuple: A tuple (block_indptr, edge_idx, edge_v, edge_w, edge_wt)
+                where positions block_indptr[b]:block_indptr[b + 1] of the
+                four aligned edge arrays hold the edges whose head lies in
+                block b, and edge_idx maps each position back to the
+                original edge index.
+        """
+        if getattr(self, '_blocked_size', None) == block_size and not self._blocked_dirty:
+            return self._blocked_csr
+
+        self._build_arrays()
+        number_of_blocks = max(1, -(-self.number_of_vertices // block_size))
+        head_blocks = self._edge_w // block_size
+
+        order = np.argsort(head_blocks, kind='stable').astype(np.int32)
+        counts = np.bincount(head_blocks, minlength=number_of_blocks)
+        block_indptr = np.zeros(number_of_blocks + 1, dtype=np.int32)
+        np.cumsum(counts, out=block_indptr[1:])
+
+        self._blocked_csr = (block_indptr, order, self._edge_v[order],
+                             self._edge_w[order], self._edge_wt[order])
+        self._blocked_size = block_size
+        self._blocked_dirty = False
+        return self._blocked_csr
 
     def adjacents(self, vertex_v):
         """
         Returns the edges adjacent to the given vertex.
-        
+
         Args:
             vertex_v (int): The vertex for which adjacent edges are to be returned.
-        
+
         Returns:
-            list: A list of edges adjacent to the given vertex.
+            list: A list of WeightedEdge views of the out-edges of the vertex.
         """
-        return self.adjacency_lists[vertex_v]
+        return [self.edge(index) for index in self.adjacency_lists[vertex_v]]
 
     @classmethod
     def from_file(cls, file_path):
         """
         Creates an edge-weighted directed graph from a file.
-        
+
+        The edge section is parsed in one np.loadtxt call and the SoA and
+        CSR arrays are assembled with argsort/bincount, so no per-line
+        Python parsing or per-edge object allocation happens; a stable
+        sort on the tail vertices groups each adjacency list while
+        preserving file order within it.
+
         Args:
             file_path (str): The path to the file containing the graph data.
-        
+
         Returns:
             EdgeWeightedDigraph: An instance of the EdgeWeightedDigraph class.
         """
         with open(file_path, 'r') as file:
-            # Read the first two lines
+            # The first line holds the vertex count
             number_of_vertices = int(file.readline().rstrip())
+            remainder = file.read()
 
-            # Print the first two lines
-            graph = cls(number_of_vertices)
-
-            # Iterate over the rest of the file
-            for line in file:
-                vertex_v, vertex_w, weight = line.rstrip().split()
-                vertex_v, vertex_w, weight = int(vertex_v), int(vertex_w), float(weight)
-                edge = WeightedEdge(vertex_v, vertex_w, weight)
-                graph.add_edge(edge)
+        graph = cls(number_of_vertices)
 
+        if not remainder.strip():
             return graph
 
+        rows = np.loadtxt(StringIO(remainder), ndmin=2)
+
+        edge_v = np.ascontiguousarray(rows[:, 0].astype(np.int32))
+        edge_w = np.ascontiguousarray(rows[:, 1].astype(np.int32))
+        edge_wt = np.ascontiguousarray(rows[:, 2])
+
+        graph.number_of_edges = rows.shape[0]
+        graph._edge_v = edge_v
+        graph._edge_w = edge_w
+        graph._edge_wt = edge_wt
+        graph._dirty = False
+
+        # Group the edge indices by tail vertex; the stable sort keeps the
+        # file order inside every adjacency list
+        order = np.argsort(edge_v, kind='stable').astype(np.int32)
+        counts = np.bincount(edge_v, minlength=number_of_vertices)
+        adj_indptr = np.zeros(number_of_vertices + 1, dtype=np.int32)
+        np.cumsum(counts, out=adj_indptr[1:])
+
+        for vertex in range(number_of_vertices):
+            graph.adjacency_lists[vertex] = order[adj_indptr[vertex]:adj_indptr[vertex + 1]].tolist()
+
+        graph._adj_indptr = adj_indptr
+        graph._adj_edges = order
+        graph._adj_nbr = edge_w[order]
+        graph._adj_wt = edge_wt[order]
+        graph._csr_dirty = False
+        return graph
+
     def to_networkx_graph(self):
         """
         Converts the graph to a NetworkX directed graph.
-        
+
         Returns:
             networkx.DiGraph: A NetworkX directed graph representing the same edge-weighted directed graph.
         """
+        self._build_arrays()
         graph = nx.DiGraph()
 
         # Add Edges to NetworkX Graph
-        for vertex_v in range(self.number_of_vertices):
-            for edge in self.adjacency_lists[vertex_v]:
-                graph.add_edge(edge.vertex_v, edge.vertex_w, weight=edge.weight)
+        graph.add_edges_from(
+            (int(vertex_v), int(vertex_w), {'weight': weight})
+            for vertex_v, vertex_w, weight
+            in zip(self._edge_v, self._edge_w, self._edge_wt))
         return graph
 
 
@@ -111,4 +331,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
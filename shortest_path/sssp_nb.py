@@ -0,0 +1,142 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    njit = None
+
+
+def bellman_ford_sssp(edge_v, edge_w, edge_wt, number_of_vertices, source):
+    """
+    Computes shortest paths with Bellman-Ford edge sweeps over SoA arrays.
+
+    Each pass relaxes every edge in a tight scalar loop and stops as soon
+    as a pass improves nothing; an improvement on pass V + 1 proves a
+    negative cycle. When numba is installed the function is compiled, so
+    the compare/add per edge runs as native code.
+
+    Args:
+        edge_v (numpy.ndarray): Tail vertex of every edge, int32 of size E.
+        edge_w (numpy.ndarray): Head vertex of every edge, int32 of size E.
+        edge_wt (numpy.ndarray): Weight of every edge, float64 of size E.
+        number_of_vertices (int): The number of vertices in the graph.
+        source (int): The source vertex.
+
+    Returns:
+        tuple: A tuple (dist_to, edge_to, has_negative_cycle) where
+            dist_to is float64 of size V, edge_to holds the parent edge
+            index of every vertex (-1 when absent) and the flag reports
+            whether the extra pass still improved a distance.
+    """
+    dist_to = np.full(number_of_vertices, np.inf)
+    edge_to = np.full(number_of_vertices, -1, dtype=np.int32)
+    dist_to[source] = 0.0
+    improved = False
+
+    for _ in range(number_of_vertices + 1):
+        improved = False
+
+        for index in range(edge_v.shape[0]):
+            candidate = dist_to[edge_v[index]] + edge_wt[index]
+
+            if candidate < dist_to[edge_w[index]]:
+                dist_to[edge_w[index]] = candidate
+                edge_to[edge_w[index]] = index
+                improved = True
+
+        if not improved:
+            break
+
+    return dist_to, edge_to, improved
+
+
+def dijkstra_sssp(adj_indptr, adj_edges, adj_nbr, adj_wt, number_of_vertices, source):
+    """
+    Computes shortest paths with Dijkstra's algorithm over CSR arrays.
+
+    The whole solver runs on typed numpy arrays: a manual binary min-heap
+    backed by parallel key/value arrays replaces heapq, stale entries are
+    skipped on pop, and adjacency is scanned straight out of the CSR
+    layout. When numba is installed the function is compiled, so the heap
+    compares and relaxations run as native code.
+
+    Args:
+        adj_indptr (numpy.ndarray): CSR row pointers into adj_edges, int32 of size V + 1.
+        adj_edges (numpy.ndarray): Edge indices of the out-edges of each vertex, int32 of size E.
+        adj_nbr (numpy.ndarray): Head vertex at each CSR position, int32 of size E.
+        adj_wt (numpy.ndarray): Weight at each CSR position, float64 of size E.
+        number_of_vertices (int): The number of vertices in the graph.
+        source (int): The source vertex.
+
+    Returns:
+        tuple: A tuple (dist_to, edge_to) where dist_to is float64 of
+            size V and edge_to holds the parent edge index of every
+            vertex (-1 when absent).
+    """
+    dist_to = np.full(number_of_vertices, np.inf)
+    edge_to = np.full(number_of_vertices, -1, dtype=np.int32)
+    dist_to[source] = 0.0
+
+    # Every push follows a successful relaxation and out-edges of a vertex
+    # are scanned at a final distance only once, so E + 1 slots suffice
+    heap_key = np.empty(adj_wt.shape[0] + 1, dtype=np.float64)
+    heap_val = np.empty(adj_wt.shape[0] + 1, dtype=np.int32)
+    heap_key[0] = 0.0
+    heap_val[0] = source
+    heap_size = 1
+
+    while heap_size > 0:
+        # Pop the closest vertex and sift the last entry down
+        distance = heap_key[0]
+        vertex = heap_val[0]
+        heap_size -= 1
+        key = heap_key[heap_size]
+        value = heap_val[heap_size]
+        parent = 0
+        child = 1
+        while child < heap_size:
+            if child + 1 < heap_size and heap_key[child + 1] < heap_key[child]:
+                child += 1
+            if key <= heap_key[child]:
+                break
+            heap_key[parent] = heap_key[child]
+            heap_val[parent] = heap_val[child]
+            parent = child
+            child = 2 * parent + 1
+        if heap_size > 0:
+            heap_key[parent] = key
+            heap_val[parent] = value
+
+        # Skip entries made stale by a later, cheaper one
+        if distance > dist_to[vertex]:
+            continue
+
+        for position in range(adj_indptr[vertex], adj_indptr[vertex + 1]):
+            vertex_w = adj_nbr[position]
+            candidate = distance + adj_wt[position]
+
+            if candidate < dist_to[vertex_w]:
+                dist_to[vertex_w] = candidate
+                edge_to[vertex_w] = adj_edges[position]
+
+                # Push (candidate, vertex_w) and sift up
+                child = heap_size
+                heap_size += 1
+                while child > 0:
+                    parent = (child - 1) >> 1
+                    if heap_key[parent] <= candidate:
+                        break
+                    heap_key[child] = heap_key[parent]
+                    heap_val[child] = heap_val[parent]
+                    child = parent
+                heap_key[child] = candidate
+                heap_val[child] = vertex_w
+
+    return dist_to, edge_to
+
+
+# nogil lets independent solver runs proceed on separate threads: each
+# works on its own dist/parent arrays and only reads the shared CSR
+if njit is not None:
+    bellman_ford_sssp = njit(cache=True, nogil=True)(bellman_ford_sssp)
+    dijkstra_sssp = njit(cache=True, nogil=True)(dijkstra_sssp)
@@ -13,7 +13,8 @@ class TopologicalOrder:
         Args:
             graph (EdgeWeightedDigraph): The edge-weighted directed graph to perform topological sorting on.
         """
-        self.marked = [False] * graph.number_of_vertices
+        # Byte flags pack one vertex per byte instead of one pointer each
+        self.marked = bytearray(graph.number_of_vertices)
         self.reverse_postorder = []
 
         for vertex in range(graph.number_of_vertices):
@@ -22,18 +23,36 @@ class TopologicalOrder:
 
     def _dfs(self, graph, vertex):
         """
-        Recursively performs DFS to compute the reverse postorder.
-        
+        Iteratively performs DFS to compute the reverse postorder.
+
+        An explicit stack of (vertex, edge iterator) pairs replaces the
+        call stack, so the traversal costs no Python frames and handles
+        paths deeper than the recursion limit. A vertex is appended to
+        the postorder when its iterator is exhausted, exactly where the
+        recursive version returned.
+
         Args:
             graph (EdgeWeightedDigraph): The edge-weighted directed graph to perform DFS on.
             vertex (int): The current vertex being visited.
         """
-        self.marked[vertex] = True
-        for edge in graph.adjacency_lists[vertex]:
-            adjacent = edge.to_edge()
-            if not self.marked[adjacent]:
-                self._dfs(graph, adjacent)
-        self.reverse_postorder.append(vertex)
+        marked = self.marked
+        edge_w = graph.edge_w
+        marked[vertex] = 1
+        stack = [(vertex, iter(graph.adjacency_lists[vertex]))]
+
+        while stack:
+            current, edge_iterator = stack[-1]
+            index = next(edge_iterator, None)
+
+            if index is None:
+                stack.pop()
+                self.reverse_postorder.append(current)
+                continue
+
+            adjacent = int(edge_w[index])
+            if not marked[adjacent]:
+                marked[adjacent] = 1
+                stack.append((adjacent, iter(graph.adjacency_lists[adjacent])))
 
     def get_order(self):
         """
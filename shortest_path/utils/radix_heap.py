@@ -0,0 +1,112 @@
+class RadixHeap:
+    """
+    A monotone priority queue for non-negative integer keys.
+
+    Entries are kept in buckets indexed by the position of the highest
+    bit in which their key differs from the last deleted minimum. Pops
+    from the lowest bucket are O(1); when it runs dry, the first
+    non-empty bucket is redistributed against its own minimum, and every
+    entry moves to a strictly lower bucket, so the total redistribution
+    work is O(total pushes * word size) amortized and no comparisons are
+    spent sifting.
+
+    The structure is monotone: a pushed key must never be smaller than
+    the last popped minimum, which Dijkstra-style clients guarantee.
+
+    Methods:
+        push(key, value): Adds an entry to the heap.
+        pop(): Removes and returns the entry with the smallest key.
+    """
+
+    # One bucket per possible differing-bit position of a 64-bit key,
+    # plus the equal-to-minimum bucket at position 0
+    _BUCKETS = 66
+
+    def __init__(self):
+        """
+        Initializes an empty radix heap.
+        """
+        self._buckets = [[] for _ in range(self._BUCKETS)]
+        self._last_min = 0
+        self._size = 0
+
+    def push(self, key, value):
+        """
+        Adds an entry to the heap.
+
+        Args:
+            key (int): The non-negative integer priority. Must not be
+                smaller than the key of the last popped entry.
+            value: The payload to associate with the key.
+        """
+        self._buckets[(key ^ self._last_min).bit_length()].append((key, value))
+        self._size += 1
+
+    def pop(self):
+        """
+        Removes and returns the entry with the smallest key.
+
+        Returns:
+            tuple: The (key, value) pair with the smallest key.
+
+        Raises:
+            IndexError: If the heap is empty.
+        """
+        if self._size == 0:
+            raise IndexError("pop from an empty radix heap")
+
+        buckets = self._buckets
+
+        if not buckets[0]:
+            # Find the first non-empty bucket and redistribute it against
+            # its own minimum; every entry lands in a lower bucket
+            index = 1
+            while not buckets[index]:
+                index += 1
+
+            bucket = buckets[index]
+            buckets[index] = []
+            self._last_min = min(entry[0] for entry in bucket)
+
+            for entry in bucket:
+                buckets[(entry[0] ^ self._last_min).bit_length()].append(entry)
+
+        self._size -= 1
+        return buckets[0].pop()
+
+    def __len__(self):
+        """
+        Returns the number of entries in the heap.
+
+        Returns:
+            int: The number of entries.
+        """
+        return self._size
+
+    def __bool__(self):
+        """
+        Returns the boolean value of the heap based on its size.
+
+        Returns:
+            bool: True if the heap is not empty, False otherwise.
+        """
+        return bool(self._size)
+
+
+def main():
+    # Push (distance, vertex) entries and pop them back in key order
+    heap = RadixHeap()
+    for key, vertex in [(5, 0), (10, 1), (2, 2), (7, 3), (3, 4)]:
+        heap.push(key, vertex)
+
+    print(f"Minimum entry: {heap.pop()}")  # Expected output: (2, 2)
+
+    # Monotone use: pushed keys never go below the last popped minimum
+    heap.push(4, 5)
+
+    while heap:
+        print(f"Next entry: {heap.pop()}")
+
+
+if __name__ == "__main__":
+    main()
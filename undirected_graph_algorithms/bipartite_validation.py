@@ -1,3 +1,4 @@
+from collections import deque
 from graph import *
 
 
@@ -8,53 +9,71 @@ class BipartiteValidation:
 
     def __init__(self, graph):
         """
-        Initializes the BipartiteValidation object and performs DFS to check bipartiteness.
-        
+        Initializes the BipartiteValidation object and performs BFS to check bipartiteness.
+
         Args:
             graph (Graph): The graph to validate.
         """
 
-        self.marked = [False] * graph.number_of_vertices
-        self.color = [-1] * graph.number_of_vertices
+        # Byte flags and byte colors pack one vertex per byte instead of
+        # one pointer each; colors are 0 uncolored, 1 and 2 the two sides
+        self.marked = bytearray(graph.number_of_vertices)
+        self.color = bytearray(graph.number_of_vertices)
         self._bipartite = True
         vertex = 0
 
-        # To remove the early ending just remove the self._bipartite checking
         while vertex < graph.number_of_vertices and self._bipartite:
             if not self.marked[vertex]:
-                self._dfs(graph, vertex)
+                self._bfs(graph, vertex)
             vertex += 1
 
     @property
     def bipartite(self):
         """
         Checks if the graph is bipartite.
-        
+
         Returns:
             bool: True if the graph is bipartite, False otherwise.
         """
 
         return self._bipartite
-    
 
-    def _dfs(self, graph, vertex):
+
+    def _bfs(self, graph, vertex):
         """
-        Recursively performs DFS to check the bipartiteness of the graph.
-        
+        Performs BFS to check the bipartiteness of the component of the given vertex.
+
+        Every component root is explicitly colored when the traversal
+        starts, so the alternating colors are well defined in all
+        components, and an odd cycle is reported the moment an edge joins
+        two vertices of the same color. The explicit queue costs no
+        Python frames and handles paths deeper than the recursion limit.
+
         Args:
             graph (Graph): The graph to validate.
-            vertex (int): The current vertex being visited.
+            vertex (int): The vertex whose component is checked.
         """
 
-        self.marked[vertex] = True
+        marked = self.marked
+        color = self.color
+        adjacency_lists = graph.adjacency_lists
+
+        marked[vertex] = 1
+        color[vertex] = 1
+        queue = deque([vertex])
 
-        for adjacent in graph.adjacency_lists[vertex]:
-            if not self.marked[adjacent]:
-                self.color[adjacent] = - self.color[vertex]
-                self._dfs(graph, adjacent)
+        while queue:
+            current = queue.popleft()
+            for adjacent in adjacency_lists[current]:
+                if not marked[adjacent]:
+                    # 3 - color flips between the two sides
+                    color[adjacent] = 3 - color[current]
+                    marked[adjacent] = 1
+                    queue.append(adjacent)
 
-            elif self.color[vertex] * self.color[adjacent] > 0:
+                elif color[adjacent] == color[current]:
                     self._bipartite = False
+                    return
 
 
 def main():
@@ -64,9 +83,9 @@ def main():
 
     FILE_PATH = "data/euler_cycle.txt"
     graph = Graph.from_file(FILE_PATH)
-    dfs = BipartiteValidation(graph)
-    print(f"Is the graph bipartite? {dfs.bipartite}")
+    bfs = BipartiteValidation(graph)
+    print(f"Is the graph bipartite? {bfs.bipartite}")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -4,78 +4,130 @@ from graph import *
 class ConnectedComponents:
     """
     A class to identify connected components in an undirected graph.
+
+    Components are built with weighted union-find instead of a DFS: every
+    edge costs near-constant amortized time, no traversal state is kept,
+    and further add-and-union calls could extend the structure without a
+    re-run. Component ids are assigned lazily on first query, numbered in
+    increasing order of their lowest vertex like the DFS labeling was.
     """
 
     def __init__(self, graph):
         """
         Initializes the connected components for the given graph.
-        
+
         Args:
             graph (Graph): The graph to analyze for connected components.
         """
 
-        self.marked = [False] * graph.number_of_vertices
-        self.id = [None] * graph.number_of_vertices
-        self._component = 0
+        self._parent = list(range(graph.number_of_vertices))
+        self._rank = [0] * graph.number_of_vertices
+        self._count = graph.number_of_vertices
+        self._id = None
 
+        # Each undirected edge appears in both adjacency sets; the
+        # ordering test unions it once
         for vertex in range(graph.number_of_vertices):
-            if not self.marked[vertex]:
-                self._dfs(graph, vertex, self._component)
-                self._component += 1
+            for adjacent in graph.adjacency_lists[vertex]:
+                if vertex < adjacent:
+                    self._union(vertex, adjacent)
+
+    def _find(self, vertex):
+        """
+        Finds the root of the component containing the vertex.
+
+        Path halving points every other vertex on the walk at its
+        grandparent, so later finds get shorter without a second pass.
+
+        Args:
+            vertex (int): The vertex to find the root for.
 
-    def _dfs(self, graph, vertex, component):
+        Returns:
+            int: The root of the component.
+        """
+
+        parent = self._parent
+        while parent[vertex] != vertex:
+            parent[vertex] = parent[parent[vertex]]
+            vertex = parent[vertex]
+        return vertex
+
+    def _union(self, vertex_v, vertex_w):
         """
-        Recursively performs DFS to identify all vertices in the same component.
-        
+        Merges the components containing the two vertices.
+
         Args:
-            graph (Graph): The graph to analyze.
-            vertex (int): The current vertex being visited.
-            component (int): The component identifier.
+            vertex_v (int): The first vertex.
+            vertex_w (int): The second vertex.
         """
 
-        self.marked[vertex] = True
-        self.id[vertex] = component
-        for adjacent in graph.adjacency_lists[vertex]:
-            if not self.marked[adjacent]:
-                self._dfs(graph, adjacent, component)
+        root_v = self._find(vertex_v)
+        root_w = self._find(vertex_w)
+
+        if root_v == root_w:
+            return
+
+        # Union by rank keeps the trees shallow
+        rank = self._rank
+        if rank[root_v] < rank[root_w]:
+            root_v, root_w = root_w, root_v
+        self._parent[root_w] = root_v
+        if rank[root_v] == rank[root_w]:
+            rank[root_v] += 1
+
+        self._count -= 1
+
+    def _canonicalize(self):
+        """
+        Builds the component id of every vertex from the union-find roots.
+
+        Runs once, on the first id query; ids count up in increasing
+        order of each component's lowest vertex.
+        """
+
+        root_ids = {}
+        self._id = [root_ids.setdefault(self._find(vertex), len(root_ids))
+                    for vertex in range(len(self._parent))]
 
     def connected(self, vertex_v, vertex_w):
         """
         Checks if two vertices are in the same connected component.
-        
+
         Args:
             vertex_v (int): The first vertex.
             vertex_w (int): The second vertex.
-        
+
         Returns:
             bool: True if the vertices are in the same component, False otherwise.
         """
 
-        return self.id[vertex_v] == self.id[vertex_w]
+        return self._find(vertex_v) == self._find(vertex_w)
 
     def count(self):
         """
         Returns the number of connected components in the graph.
-        
+
         Returns:
             int: The number of connected components.
         """
 
-        return self._component
+        return self._count
 
     def id_vertex(self, vertex):
         """
         Returns the component id of the given vertex.
-        
+
         Args:
             vertex (int): The vertex to query.
-        
+
         Returns:
             int: The component id of the vertex.
         """
 
-        return self.id[vertex]
-                
+        if self._id is None:
+            self._canonicalize()
+        return self._id[vertex]
+
 
 def main():
     """
@@ -84,13 +136,13 @@ def main():
 
     FILE_PATH = "data/graph_test.txt"
     graph = Graph.from_file(FILE_PATH)
-    dfs = ConnectedComponents(graph)
-    print(f"Number of connected components: {dfs.count()}")
+    components = ConnectedComponents(graph)
+    print(f"Number of connected components: {components.count()}")
     vertex_v, vertex_w = 2, 10
-    print(f"Vertex {vertex_v} connected to vertex {vertex_w}? {dfs.connected(vertex_v, vertex_w)}")
-    print(f"Vertex {vertex_v} belongs to component: {dfs.id_vertex(vertex_v)}")
-    print(f"Vertex {vertex_w} belongs to component: {dfs.id_vertex(vertex_w)}")
+    print(f"Vertex {vertex_v} connected to vertex {vertex_w}? {components.connected(vertex_v, vertex_w)}")
+    print(f"Vertex {vertex_v} belongs to component: {components.id_vertex(vertex_v)}")
+    print(f"Vertex {vertex_w} belongs to component: {components.id_vertex(vertex_w)}")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -17,7 +17,8 @@ class Cycle:
             graph (Graph): The graph to check for cycles.
         """
 
-        self.marked = [False] * graph.number_of_vertices
+        # Byte flags pack one vertex per byte instead of one pointer each
+        self.marked = bytearray(graph.number_of_vertices)
         self.edge_to = [None] * graph.number_of_vertices
         self.cycle = deque()
 
@@ -48,7 +49,7 @@ class Cycle:
             parent_vertex (int): The parent vertex of the current vertex.
         """
 
-        self.marked[current_vertex] = True
+        self.marked[current_vertex] = 1
         for adjacent in graph.adjacency_lists[current_vertex]:
             if self.has_cycle:
                 return
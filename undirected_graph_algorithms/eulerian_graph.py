@@ -1,8 +1,17 @@
+from io import StringIO
+import numpy as np
+
+
 class EulerianGraph:
     """
     A class to identify and generate Eulerian tours and paths in an undirected graph.
     """
 
+    # No per-instance __dict__: attribute access skips a dict probe and
+    # each instance drops the dict's memory overhead
+    __slots__ = ('_graph', '_mate_idx', '_tour', '_tour_str', '_odd_count',
+                 '_valid_cache')
+
     def __init__(self, vertices):
         """
         Initializes the EulerianGraph object.
@@ -11,8 +20,23 @@ class EulerianGraph:
             vertices (int): The number of vertices in the graph.
         """
 
-        self._graph = {i: [] for i in range(vertices)}
+        # Dense lists of lists: vertices are 0..V - 1, so indexing needs
+        # no hashing the way a dict keyed by vertex would
+        self._graph = [[] for _ in range(vertices)]
+        # _mate_idx[v][i] is the slot of the mirror entry in the list of
+        # the vertex stored at _graph[v][i]; the cross-links let
+        # remove_edge drop both entries by swap-pop instead of scanning
+        # and shifting the mirror list
+        self._mate_idx = [[] for _ in range(vertices)]
         self._tour = []
+        self._tour_str = None
+
+        # Degree parity and validity are maintained incrementally: the
+        # mutators toggle _odd_count per endpoint and drop the cached
+        # verdict and tour, so euler_tour never rescans degrees and only
+        # redoes the connectivity search after the graph changed
+        self._odd_count = 0
+        self._valid_cache = None
 
     @property
     def euler_tour(self):
@@ -25,12 +49,18 @@ class EulerianGraph:
 
         if not self._valid_eulerian():
             return None
-        
-        # If the Eulerian tour has not yet been calculated, initiate its computation
-        if not self._tour:
-            self._get_euler_tour()
 
-        return ' -> '.join(str(vertex) for vertex in self._tour)
+        # The rendered string is cached alongside the tour, so repeated
+        # reads pay no join; map(str, ...) drives the one build with a
+        # C-level mapper instead of a generator frame per vertex
+        if self._tour_str is None:
+            # If the Eulerian tour has not yet been calculated, initiate its computation
+            if not self._tour:
+                self._get_euler_tour()
+
+            self._tour_str = ' -> '.join(map(str, self._tour))
+
+        return self._tour_str
 
     def add_edge(self, vertex_v, vertex_w):
         """
@@ -41,129 +71,238 @@ class EulerianGraph:
             vertex_w (int): The second vertex.
         """
 
+        if vertex_v == vertex_w:
+            # Both halves of a self-loop land in the same list, so the
+            # mates are the two freshly appended slots
+            adjacency = self._graph[vertex_v]
+            mates = self._mate_idx[vertex_v]
+            adjacency.append(vertex_v)
+            adjacency.append(vertex_v)
+            mates.append(len(adjacency) - 1)
+            mates.append(len(adjacency) - 2)
+
+            # A self-loop adds two to the degree, so parity is unchanged
+            self._invalidate()
+            return
+
         self._graph[vertex_v].append(vertex_w)
         self._graph[vertex_w].append(vertex_v)
+        self._mate_idx[vertex_v].append(len(self._graph[vertex_w]) - 1)
+        self._mate_idx[vertex_w].append(len(self._graph[vertex_v]) - 1)
+
+        self._toggle_parity(vertex_v)
+        self._toggle_parity(vertex_w)
+        self._invalidate()
 
     def remove_edge(self, vertex_v, vertex_w):
         """
         Removes the edge between the specified vertices.
-        
+
+        The mirror entry is located through its mate index and both ends
+        are dropped by swap-pop, so no list is scanned twice or shifted.
+
         Args:
             vertex_v (int): The first vertex.
             vertex_w (int): The second vertex.
         """
 
-        self._graph[vertex_v].remove(vertex_w)
-        self._graph[vertex_w].remove(vertex_v)
+        slot = self._graph[vertex_v].index(vertex_w)
+        mate = self._mate_idx[vertex_v][slot]
 
-    def _get_euler_tour(self):
-        """
-        Computes the Eulerian tour if it exists.
-        """
-
-        # Start from 0 for a Eulerian cycle
-        if self._has_eulerian_cycle():
-            source = 0
-
-        # Look for an odd vertex for a Eulerian path
+        if vertex_v == vertex_w:
+            # Both slots sit in the same list: pop the higher one first
+            # so the lower slot is not disturbed by the swap
+            self._swap_pop(vertex_v, max(slot, mate))
+            self._swap_pop(vertex_v, min(slot, mate))
         else:
-            for vertex in range(len(self._graph)):
-                if len(self._graph[vertex]) % 2 != 0:
-                    source = vertex
-                    break
+            self._swap_pop(vertex_v, slot)
+            self._swap_pop(vertex_w, mate)
+            self._toggle_parity(vertex_v)
+            self._toggle_parity(vertex_w)
 
-        self._tour.append(source)
-        self._dfs_euler(source)
+        self._invalidate()
 
-    def _dfs_euler(self, vertex):
+    def _toggle_parity(self, vertex):
         """
-        Recursively performs DFS to generate the Eulerian tour.
-        
+        Updates the odd-degree count after the vertex degree changed by one.
+
         Args:
-            vertex (int): The current vertex being visited.
+            vertex (int): The vertex whose degree was just changed.
         """
 
-        for adjacent in self._graph[vertex]:
-            if self._edge_is_not_bridge(vertex, adjacent):
-                self._tour.append(adjacent)
-                self.remove_edge(vertex, adjacent)
-                self._dfs_euler(adjacent)
+        if len(self._graph[vertex]) & 1:
+            self._odd_count += 1
+        else:
+            self._odd_count -= 1
 
-    def _edge_is_not_bridge(self, vertex, neighbor):
+    def _invalidate(self):
         """
-        Checks if an edge is not a bridge, i.e., its removal does not increase the number of connected components.
-        
-        Args:
-            vertex (int): The first vertex of the edge.
-            neighbor (int): The second vertex of the edge.
-        
-        Returns:
-            bool: True if the edge is not a bridge, False otherwise.
+        Drops the cached validity verdict and tour after a mutation.
         """
 
-        # If the vertex has only one adjacent vertex (degree of 1),
-        # it must be chosen as there are no other options
-        if len(self._graph[vertex]) == 1:
-            return True
+        self._valid_cache = None
+        self._tour = []
+        self._tour_str = None
 
-        # Count the number of reachable vertices from vertex
-        marked = [False] * len(self._graph)
-        count = self._dfs_count(vertex, marked)
+    def _swap_pop(self, vertex, slot):
+        """
+        Removes one adjacency slot by overwriting it with the last entry.
+
+        The moved entry's mirror is re-pointed at its new slot, keeping
+        the cross-links consistent, so the removal costs O(1) regardless
+        of the vertex degree.
+
+        Args:
+            vertex (int): The vertex whose adjacency list loses a slot.
+            slot (int): The slot to remove.
+        """
 
-        # Count the number of reachable vertices from vertex when
-        # the edge vertex-neighbor is removed
-        self.remove_edge(vertex, neighbor)
-        marked = [False] * len(self._graph)
-        count_without_edge = self._dfs_count(vertex, marked)
+        adjacency = self._graph[vertex]
+        mates = self._mate_idx[vertex]
+        last = len(adjacency) - 1
 
-        # restore the connection
-        self.add_edge(vertex, neighbor)
+        if slot != last:
+            moved_vertex = adjacency[last]
+            moved_mate = mates[last]
+            adjacency[slot] = moved_vertex
+            mates[slot] = moved_mate
+            self._mate_idx[moved_vertex][moved_mate] = slot
 
-        # If the edge vertex-neighbor is not a bridge, count doesn't have to change
-        return count == count_without_edge
+        adjacency.pop()
+        mates.pop()
 
-    def _dfs_count(self, vertex, marked):
+    def _get_euler_tour(self):
         """
-        Counts the number of reachable vertices from vertex recursively.
-        
-        Args:
-            vertex (int): The starting vertex.
-            marked (list of bool): List to keep track of visited vertices.
-        
-        Returns:
-            int: The count of reachable vertices.
+        Computes the Eulerian tour with Hierholzer's algorithm.
+
+        Every edge gets an id shared by its two mirror entries in an
+        indexed working copy of the adjacency lists, so consuming an edge
+        is a single flag write and the walk never mutates the graph. The
+        tour is collected in reverse as exhausted vertices are popped off
+        an explicit stack, which splices the sub-tours together in O(V + E)
+        overall, against the O(E * (V + E)) of Fleury's per-step bridge
+        checks.
         """
 
-        count = 1
-        marked[vertex] = True
-        for adjacent in self._graph[vertex]:
-            if not marked[adjacent]:
-                count += self._dfs_count(adjacent, marked)
-        return count
+        graph = self._graph
+        number_of_vertices = len(graph)
+
+        # Start from 0 for a Eulerian cycle
+        if self._has_eulerian_cycle():
+            source = 0
+
+        # Look for an odd vertex for a Eulerian path
+        else:
+            for vertex in range(number_of_vertices):
+                if len(graph[vertex]) & 1:
+                    source = vertex
+                    break
+
+        # Build the indexed copy: an edge between distinct vertices shows
+        # up once with adjacent > vertex per parallel copy, and a self
+        # loop as two equal entries in the same list
+        adjacency = [[] for _ in range(number_of_vertices)]
+        edge_count = 0
+
+        for vertex in range(number_of_vertices):
+            loops = 0
+
+            for adjacent in graph[vertex]:
+                if adjacent > vertex:
+                    adjacency[vertex].append((adjacent, edge_count))
+                    adjacency[adjacent].append((vertex, edge_count))
+                    edge_count += 1
+                elif adjacent == vertex:
+                    loops += 1
+
+            for _ in range(loops // 2):
+                adjacency[vertex].append((vertex, edge_count))
+                adjacency[vertex].append((vertex, edge_count))
+                edge_count += 1
+
+        # Per-vertex cursors only ever move forward, so every adjacency
+        # entry is inspected at most twice across the whole walk
+        used = bytearray(edge_count)
+        position = [0] * number_of_vertices
+        stack = [source]
+        tour = []
+
+        while stack:
+            vertex = stack[-1]
+            neighbors = adjacency[vertex]
+            index = position[vertex]
+
+            while index < len(neighbors) and used[neighbors[index][1]]:
+                index += 1
+
+            if index == len(neighbors):
+                # No unused edge left here: the vertex joins the tour
+                position[vertex] = index
+                stack.pop()
+                tour.append(vertex)
+            else:
+                adjacent, edge_id = neighbors[index]
+                used[edge_id] = 1
+                position[vertex] = index + 1
+                stack.append(adjacent)
+
+        # Sub-tours were emitted last-first; one reverse orients the walk
+        tour.reverse()
+        self._tour = tour
 
     def _all_connected(self):
         """
         Checks if all vertices in the graph are connected.
-        
+
+        Runs a bit-parallel BFS: each adjacency list is folded into one
+        big-int mask, and expanding a whole frontier is then a handful
+        of big-int OR/AND operations that process the vertex set about a
+        machine word at a time, instead of a Python-level step per edge.
+
         Returns:
             bool: True if all vertices are connected, False otherwise.
         """
 
-        vertex = 0
-        marked = [False] * len(self._graph)
-        count = self._dfs_count(vertex, marked)
-        return count == len(self._graph)
+        graph = self._graph
+        number_of_vertices = len(graph)
+
+        adjacency_masks = [0] * number_of_vertices
+        for vertex in range(number_of_vertices):
+            mask = 0
+            for adjacent in graph[vertex]:
+                mask |= 1 << adjacent
+            adjacency_masks[vertex] = mask
+
+        visited = 1
+        frontier = 1
+
+        while frontier:
+            reached = 0
+
+            # Peel the set bits of the frontier lowest-first and union
+            # their neighborhoods in bulk
+            while frontier:
+                vertex = (frontier & -frontier).bit_length() - 1
+                reached |= adjacency_masks[vertex]
+                frontier &= frontier - 1
+
+            frontier = reached & ~visited
+            visited |= frontier
+
+        return visited == (1 << number_of_vertices) - 1
 
     def _number_of_odd_vertices(self):
         """
         Returns the number of vertices with an odd degree.
-        
+
+        The count is maintained incrementally by the mutators, so this
+        is an O(1) read instead of a scan over every adjacency list.
+
         Returns:
             int: The number of vertices with an odd degree.
         """
 
-        number_of_odd_vertices = sum([1 for vertex in self._graph if len(self._graph[vertex]) % 2 != 0])
-        return number_of_odd_vertices
+        return self._odd_count
 
     def _has_eulerian_cycle(self):
         """
@@ -191,38 +330,81 @@ class EulerianGraph:
         """
         Validates if the graph is either Eulerian or semi-Eulerian.
         
+        The verdict is cached and recomputed only after a mutation. The
+        O(1) degree-parity checks run first, so the connectivity search
+        only happens on graphs that can possibly be Eulerian.
+
         Returns:
             bool: True if the graph is Eulerian or semi-Eulerian, False otherwise.
         """
 
-        return self._all_connected() and (self._has_eulerian_path() or self._has_eulerian_cycle())
+        if self._valid_cache is None:
+            self._valid_cache = ((self._has_eulerian_path() or self._has_eulerian_cycle())
+                                 and self._all_connected())
+
+        return self._valid_cache
 
     @classmethod
     def from_file(cls, file_path):
         """
         Creates an EulerianGraph instance from a file.
-        
+
+        The edge section is parsed in one np.loadtxt call and the
+        adjacency and mate-index lists are assembled with argsort slices
+        over interleaved directed entries, reproducing exactly what a
+        sequence of add_edge calls would build but with no per-line
+        Python parsing or per-edge method dispatch.
+
         Args:
             file_path (str): The path to the file containing the graph data.
-        
+
         Returns:
             EulerianGraph: An instance of the EulerianGraph class.
         """
 
         with open(file_path, 'r') as file:
-            # Read the first two lines
+            # The first line holds the vertex count
             number_of_vertices = int(file.readline().rstrip())
+            remainder = file.read()
 
-            # Print the first two lines
-            graph = cls(number_of_vertices)
-
-            # Iterate over the rest of the file
-            for line in file:
-                vertex_v, vertex_w = map(int, line.rstrip().split())
-                graph.add_edge(vertex_v, vertex_w)
+        graph = cls(number_of_vertices)
 
+        if not remainder.strip():
             return graph
 
+        rows = np.loadtxt(StringIO(remainder), dtype=np.int32, ndmin=2)
+        number_of_edges = rows.shape[0]
+
+        # Interleave the two directed entries of every edge, so entry
+        # 2i and its mirror 2i + 1 differ only in the lowest bit and a
+        # stable sort on the sources replays the add_edge append order
+        source = np.empty(2 * number_of_edges, dtype=np.int32)
+        destination = np.empty(2 * number_of_edges, dtype=np.int32)
+        source[0::2] = rows[:, 0]
+        destination[0::2] = rows[:, 1]
+        source[1::2] = rows[:, 1]
+        destination[1::2] = rows[:, 0]
+
+        order = np.argsort(source, kind='stable')
+        counts = np.bincount(source, minlength=number_of_vertices)
+        indptr = np.zeros(number_of_vertices + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+
+        # Each entry's slot is its rank within its source vertex; the
+        # mate links then come from the mirror entries' slots
+        slot = np.empty(2 * number_of_edges, dtype=np.int64)
+        slot[order] = np.arange(2 * number_of_edges) - indptr[source[order]]
+        sorted_destination = destination[order]
+        sorted_mates = slot[order ^ 1]
+
+        for vertex in range(number_of_vertices):
+            start, end = indptr[vertex], indptr[vertex + 1]
+            graph._graph[vertex] = sorted_destination[start:end].tolist()
+            graph._mate_idx[vertex] = sorted_mates[start:end].tolist()
+
+        graph._odd_count = int(np.count_nonzero(counts % 2))
+        return graph
+
 
 def main():
     """
@@ -1,10 +1,18 @@
+from io import StringIO
 import networkx as nx
 import matplotlib.pyplot as plt
+import numpy as np
 
 
 class Graph:
     """Represents an undirected graph using adjacency lists."""
 
+    # No per-instance __dict__: attribute access skips a dict probe and
+    # each instance drops the dict's memory overhead
+    __slots__ = ('number_of_vertices', 'adjacency_lists', '_indptr', '_indices',
+                 '_csr_dirty', '_degrees', '_degree_sum', '_self_loops',
+                 '_max_degree', '_max_dirty', '_edge_keys')
+
     def __init__(self, number_of_vertices):
         """
         Initializes the graph with the given number of vertices.
@@ -14,18 +22,74 @@ class Graph:
         """
         
         self.number_of_vertices = number_of_vertices
-        self.adjacency_lists = {vertex: set() for vertex in range(self.number_of_vertices)}
+        # A dense list of sets: vertices are 0..V - 1, so indexing needs
+        # no hashing the way a dict keyed by vertex would
+        self.adjacency_lists = [set() for _ in range(self.number_of_vertices)]
+
+        # Frozen CSR adjacency, rebuilt lazily after mutations
+        self._indptr = None
+        self._indices = None
+        self._csr_dirty = True
+
+        # Degree and self-loop statistics maintained by the mutators, so
+        # the stat queries answer in O(1) instead of scanning every set.
+        # The maximum is only invalidated when a vertex holding it loses
+        # an edge, and recomputed lazily on the next query
+        self._degrees = [0] * number_of_vertices
+        self._degree_sum = 0
+        self._self_loops = 0
+        self._max_degree = 0
+        self._max_dirty = False
+
+        # Every edge packed as (min << 32 | max) in one global set, so
+        # edge-existence queries hash a single compact int instead of
+        # probing a per-vertex set of boxed neighbors
+        self._edge_keys = set()
+
+    def freeze(self):
+        """
+        Returns the adjacency structure in Compressed Sparse Row (CSR) form.
+
+        The neighbors of a vertex v occupy positions
+        indptr[v]:indptr[v + 1] of the flat indices array, so traversals
+        scan contiguous int32 entries instead of chasing per-neighbor set
+        buckets. The arrays are cached and rebuilt only after an edge was
+        added or removed.
+
+        Returns:
+            tuple: A tuple (indptr, indices) where indptr is int32 of
+                size V + 1 and indices is int32 of size 2E.
+        """
+
+        if not self._csr_dirty:
+            return self._indptr, self._indices
+
+        number_of_vertices = self.number_of_vertices
+        indptr = np.zeros(number_of_vertices + 1, dtype=np.int32)
+
+        for vertex in range(number_of_vertices):
+            indptr[vertex + 1] = indptr[vertex] + len(self.adjacency_lists[vertex])
+
+        indices = np.fromiter(
+            (adjacent for vertex in range(number_of_vertices)
+             for adjacent in self.adjacency_lists[vertex]),
+            dtype=np.int32, count=int(indptr[-1]))
+
+        self._indptr = indptr
+        self._indices = indices
+        self._csr_dirty = False
+        return indptr, indices
 
     @property
     def number_of_edges(self):
         """
         Returns the number of edges in the graph.
-        
+
         Returns:
             int: The total number of edges.
         """
 
-        return sum([len(adjacency_list) for adjacency_list in self.adjacency_lists.values()]) // 2
+        return self._degree_sum // 2
 
     def add_edge(self, vertex_v, vertex_w):
         """
@@ -36,8 +100,31 @@ class Graph:
             vertex_w (int): The second vertex.
         """
 
+        # The sets deduplicate, so a repeated edge must not move the stats
+        if vertex_w in self.adjacency_lists[vertex_v]:
+            return
+
         self.adjacency_lists[vertex_v].add(vertex_w)
         self.adjacency_lists[vertex_w].add(vertex_v)
+        self._csr_dirty = True
+
+        if vertex_v == vertex_w:
+            # A self-loop occupies a single set slot on its one vertex
+            self._degrees[vertex_v] += 1
+            self._degree_sum += 1
+            self._self_loops += 1
+        else:
+            self._degrees[vertex_v] += 1
+            self._degrees[vertex_w] += 1
+            self._degree_sum += 2
+
+        if not self._max_dirty:
+            self._max_degree = max(self._max_degree, self._degrees[vertex_v],
+                                   self._degrees[vertex_w])
+
+        if vertex_v > vertex_w:
+            vertex_v, vertex_w = vertex_w, vertex_v
+        self._edge_keys.add(vertex_v << 32 | vertex_w)
 
     def remove_edge(self, vertex_v, vertex_w):
         """
@@ -50,6 +137,37 @@ class Graph:
 
         self.adjacency_lists[vertex_v].remove(vertex_w)
         self.adjacency_lists[vertex_w].remove(vertex_v)
+        self._csr_dirty = True
+
+        # The cached maximum only becomes stale when a vertex holding it
+        # just lost an edge
+        if (self._degrees[vertex_v] == self._max_degree
+                or self._degrees[vertex_w] == self._max_degree):
+            self._max_dirty = True
+
+        self._degrees[vertex_v] -= 1
+        self._degrees[vertex_w] -= 1
+        self._degree_sum -= 2
+
+        if vertex_v > vertex_w:
+            vertex_v, vertex_w = vertex_w, vertex_v
+        self._edge_keys.remove(vertex_v << 32 | vertex_w)
+
+    def has_edge(self, vertex_v, vertex_w):
+        """
+        Checks whether an edge connects the specified vertices.
+
+        Args:
+            vertex_v (int): The first vertex.
+            vertex_w (int): The second vertex.
+
+        Returns:
+            bool: True if the edge exists, False otherwise.
+        """
+
+        if vertex_v > vertex_w:
+            vertex_v, vertex_w = vertex_w, vertex_v
+        return vertex_v << 32 | vertex_w in self._edge_keys
 
     def adjacents(self, vertex_v):
         """
@@ -75,17 +193,21 @@ class Graph:
             int: The degree of the vertex.
         """
 
-        return len(self.adjacency_lists[vertex_v])
+        return self._degrees[vertex_v]
 
     def max_degree(self):
         """
         Returns the maximum degree of any vertex in the graph.
-        
+
         Returns:
             int: The maximum degree.
         """
 
-        return max([len(adjacency_list) for adjacency_list in self.adjacency_lists.values()])
+        if self._max_dirty:
+            self._max_degree = max(self._degrees)
+            self._max_dirty = False
+
+        return self._max_degree
 
     def average_degree(self):
         """
@@ -105,39 +227,64 @@ class Graph:
             int: The number of self-loops.
         """
 
-        count = 0
-        for vertex_v in self.adjacency_lists.keys():
-            for vertex_w in self.adjacency_lists[vertex_v]:
-                if vertex_v == vertex_w:
-                    count += 1
-        return count // 2
+        # The halving matches the original scan, which saw each loop
+        # once (sets deduplicate) and still divided the total by two
+        return self._self_loops // 2
 
     @classmethod
     def from_file(cls, file_path):
         """
         Creates a graph instance from a file (Alternative constructor).
-        
+
+        The edge section is parsed in one np.loadtxt call and the
+        adjacency sets are filled from argsort/bincount slices, so no
+        per-line Python parsing or per-edge method dispatch happens.
+
         Args:
             file_path (str): The path to the file containing the graph data.
-        
+
         Returns:
             Graph: An instance of the Graph class.
         """
 
         with open(file_path, 'r') as file:
-            # Read the first two lines
+            # The first line holds the vertex count
             number_of_vertices = int(file.readline().rstrip())
+            remainder = file.read()
 
-            # Print the first two lines
-            graph = cls(number_of_vertices)
-
-            # Iterate over the rest of the file
-            for line in file:
-                vertex_v, vertex_w = map(int, line.rstrip().split())
-                graph.add_edge(vertex_v, vertex_w)
+        graph = cls(number_of_vertices)
 
+        if not remainder.strip():
             return graph
 
+        rows = np.loadtxt(StringIO(remainder), dtype=np.int32, ndmin=2)
+
+        # Each undirected edge contributes a directed entry both ways;
+        # a stable sort on the sources groups every adjacency slice
+        edge_v = np.concatenate((rows[:, 0], rows[:, 1]))
+        edge_w = np.concatenate((rows[:, 1], rows[:, 0]))
+        order = np.argsort(edge_v, kind='stable')
+        counts = np.bincount(edge_v, minlength=number_of_vertices)
+        indptr = np.zeros(number_of_vertices + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+
+        sorted_w = edge_w[order]
+        for vertex in range(number_of_vertices):
+            graph.adjacency_lists[vertex] = set(
+                sorted_w[indptr[vertex]:indptr[vertex + 1]].tolist())
+
+        # Prime the incremental statistics from the deduplicated sets
+        graph._degrees = [len(adjacency) for adjacency in graph.adjacency_lists]
+        graph._degree_sum = sum(graph._degrees)
+        graph._max_degree = max(graph._degrees)
+        graph._self_loops = sum(1 for vertex in range(number_of_vertices)
+                                if vertex in graph.adjacency_lists[vertex])
+
+        small = np.minimum(rows[:, 0], rows[:, 1]).astype(np.int64)
+        large = np.maximum(rows[:, 0], rows[:, 1]).astype(np.int64)
+        graph._edge_keys = set((small << 32 | large).tolist())
+        return graph
+
     def to_networkx_graph(self):
         """
         Converts the graph to a NetworkX graph.
@@ -149,10 +296,13 @@ class Graph:
         # Create an empty undirected graph using NetworkX
         graph = nx.Graph()
 
-        # Add Edges to NetworkX Graph
-        for vertex_v in range(self.number_of_vertices):
-            for vertex_w in self.adjacency_lists[vertex_v]:
-                graph.add_edge(vertex_v, vertex_w)
+        # One bulk call visiting each edge once, instead of a Python
+        # add_edge dispatch per adjacency entry (each edge twice)
+        graph.add_edges_from(
+            (vertex_v, vertex_w)
+            for vertex_v in range(self.number_of_vertices)
+            for vertex_w in self.adjacency_lists[vertex_v]
+            if vertex_w >= vertex_v)
         return graph
 
 
@@ -0,0 +1,100 @@
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    njit = None
+    prange = range
+
+
+def _count_from(start, indptr, indices, number_of_vertices):
+    """
+    Counts the Hamiltonian paths that begin at one start vertex.
+
+    The backtracking search runs on typed numpy arrays: an explicit stack
+    of vertices with per-level neighbor cursors replaces the recursive
+    calls, and adjacency is scanned straight out of the CSR layout. The
+    marked and stack arrays are allocated here, so each parallel worker
+    owns its own copies and no state is shared between starts.
+
+    Args:
+        start (int): The vertex every counted path begins at.
+        indptr (numpy.ndarray): CSR row pointers into indices, int32 of size V + 1.
+        indices (numpy.ndarray): Neighbors of each vertex, int32 of size 2E.
+        number_of_vertices (int): The number of vertices in the graph.
+
+    Returns:
+        int: The number of Hamiltonian paths starting at start.
+    """
+    marked = np.zeros(number_of_vertices, dtype=np.uint8)
+    stack_vertex = np.empty(number_of_vertices, dtype=np.int32)
+    stack_position = np.empty(number_of_vertices, dtype=np.int64)
+    count = 0
+
+    depth = 0
+    stack_vertex[0] = start
+    stack_position[0] = indptr[start]
+    marked[start] = 1
+
+    if number_of_vertices == 1:
+        count += 1
+
+    while depth >= 0:
+        vertex = stack_vertex[depth]
+        position = stack_position[depth]
+        moved = False
+
+        while position < indptr[vertex + 1]:
+            adjacent = indices[position]
+            position += 1
+
+            if marked[adjacent] == 0:
+                # Remember where to resume, then descend
+                stack_position[depth] = position
+                depth += 1
+                stack_vertex[depth] = adjacent
+                stack_position[depth] = indptr[adjacent]
+                marked[adjacent] = 1
+
+                if depth == number_of_vertices - 1:
+                    count += 1
+
+                moved = True
+                break
+
+        if not moved:
+            # Neighbors exhausted: backtrack past this vertex
+            marked[vertex] = 0
+            depth -= 1
+
+    return count
+
+
+def hamilton_count(indptr, indices, number_of_vertices):
+    """
+    Counts the Hamiltonian paths of the graph over CSR arrays.
+
+    The searches from different start vertices are independent, so the
+    outer loop runs as a prange when numba is installed: each worker
+    explores its own starts with private marked and stack arrays, and
+    the per-start counts are summed by the parallel reduction.
+
+    Args:
+        indptr (numpy.ndarray): CSR row pointers into indices, int32 of size V + 1.
+        indices (numpy.ndarray): Neighbors of each vertex, int32 of size 2E.
+        number_of_vertices (int): The number of vertices in the graph.
+
+    Returns:
+        int: The number of Hamiltonian paths, counting each direction.
+    """
+    count = 0
+
+    for start in prange(number_of_vertices):
+        count += _count_from(start, indptr, indices, number_of_vertices)
+
+    return count
+
+
+if njit is not None:
+    _count_from = njit(cache=True, nogil=True)(_count_from)
+    hamilton_count = njit(cache=True, parallel=True)(hamilton_count)
@@ -1,43 +1,151 @@
 from graph import *
+from hamilton_nb import hamilton_count, njit
 
 
 class HamiltonPath:
     """
     Finds Hamiltonian paths in a given graph.
+
+    When numba is installed the whole enumeration runs as the compiled
+    kernel in hamilton_nb over the frozen CSR arrays; otherwise it falls
+    back to the interpreted iterative backtracking below.
     """
 
+    # No per-instance __dict__: attribute access skips a dict probe and
+    # each instance drops the dict's memory overhead
+    __slots__ = ('_mask', 'count')
+
     def __init__(self, graph):
         """
         Initializes the HamiltonPath object and finds Hamiltonian paths.
-        
+
         Args:
             graph (Graph): The graph to find Hamiltonian paths in.
         """
-        self.marked = [False] * graph.number_of_vertices
+        # One big-int bitmask replaces the per-vertex visited list: for
+        # graphs of up to 64 vertices it is a single machine word, and
+        # set/clear/test are plain shifts with no indexing
+        self._mask = 0
         self.count = 0
 
+        if njit is not None:
+            indptr, indices = graph.freeze()
+            self.count = int(hamilton_count(indptr, indices, graph.number_of_vertices))
+            return
+
         for vertex in range(graph.number_of_vertices):
             self._dfs(graph, vertex, 1)
 
     def _dfs(self, graph, vertex, depth):
         """
         Depth-first search to find Hamiltonian paths.
-        
+
+        The backtracking runs over an explicit stack of (vertex, iterator)
+        pairs: pushing a pair marks the vertex and popping it unmarks it,
+        which reproduces the recursive enter/leave semantics without a
+        call frame per vertex or a recursion-depth ceiling. Two prunes
+        shrink the search tree without changing the count: neighbors with
+        few unvisited neighbors of their own are tried first, so dead
+        ends fail fast, and an extension is skipped outright when the
+        unvisited vertices are no longer all reachable from it.
+
         Args:
             graph (Graph): The graph to perform DFS on.
             vertex (int): The current vertex being visited.
             depth (int): The current depth of the search.
         """
-        self.marked[vertex] = True
+        # Local bindings keep the inner loop free of attribute probes;
+        # the count is accumulated locally and stored back once
+        adjacency_lists = graph.adjacency_lists
+        number_of_vertices = graph.number_of_vertices
+        candidates = self._candidates
+        unmarked_reachable = self._unmarked_reachable
+        count = 0
+
+        mask = self._mask | 1 << vertex
+        if depth == number_of_vertices:
+            count += 1
+        stack = [(vertex, iter(candidates(adjacency_lists, vertex, mask)))]
+
+        while stack:
+            current, neighbors = stack[-1]
+
+            for adjacent in neighbors:
+                extended = mask | 1 << adjacent
+
+                # A completion must visit every remaining vertex, so all
+                # of them have to stay reachable from the new head
+                # through unvisited vertices only
+                if (depth + 1 + unmarked_reachable(adjacency_lists, adjacent, extended)
+                        < number_of_vertices):
+                    continue
+
+                mask = extended
+                depth += 1
+                if depth == number_of_vertices:
+                    count += 1
+                stack.append((adjacent, iter(candidates(adjacency_lists, adjacent, mask))))
+                break
+            else:
+                # Neighbors exhausted: backtrack past this vertex
+                mask &= ~(1 << current)
+                depth -= 1
+                stack.pop()
+
+        self.count += count
+
+    @staticmethod
+    def _candidates(adjacency_lists, vertex, mask):
+        """
+        Returns the unvisited neighbors of a vertex, most constrained first.
+
+        Ordering by ascending count of unvisited neighbors is the
+        Warnsdorff heuristic: branches that are about to run out of
+        options are explored (and abandoned) before the wide ones. The
+        visited mask cannot change between pushing the list and draining
+        it, because descendants restore it on backtrack, so the list
+        stays valid for the whole iteration.
+
+        Args:
+            adjacency_lists (dict): The adjacency lists of the graph.
+            vertex (int): The vertex whose neighbors are wanted.
+            mask (int): The bitmask of visited vertices.
+
+        Returns:
+            list: The unvisited neighbors in exploration order.
+        """
+        candidates = [adjacent for adjacent in adjacency_lists[vertex]
+                      if not mask >> adjacent & 1]
+        candidates.sort(key=lambda adjacent: sum(
+            1 for other in adjacency_lists[adjacent] if not mask >> other & 1))
+        return candidates
+
+    @staticmethod
+    def _unmarked_reachable(adjacency_lists, start, mask):
+        """
+        Counts the unvisited vertices reachable from start.
 
-        if depth == graph.number_of_vertices:
-            self.count += 1
+        Args:
+            adjacency_lists (dict): The adjacency lists of the graph.
+            start (int): The vertex the search fans out from.
+            mask (int): The bitmask of visited vertices.
+
+        Returns:
+            int: The number of unvisited vertices reachable through
+                unvisited vertices, not counting start itself.
+        """
+        seen = mask
+        stack = [start]
+        count = 0
 
-        for adjacent in graph.adjacency_lists[vertex]:
-            if not self.marked[adjacent]:
-                self._dfs(graph, adjacent, depth + 1)
+        while stack:
+            for adjacent in adjacency_lists[stack.pop()]:
+                if not seen >> adjacent & 1:
+                    seen |= 1 << adjacent
+                    count += 1
+                    stack.append(adjacent)
 
-        self.marked[vertex] = False
+        return count
 
 
 def main():